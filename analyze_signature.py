@@ -20,29 +20,25 @@ def analyze_signature(sig_path):
     for key in ['pose', 'left_hand', 'right_hand']:
         print(f"\n{key.upper()}:")
         
-        # Collect all frames for this landmark type
-        trajectories = []
-        for frame in sig['frames']:
-            if frame.get(key) is not None:
-                trajectories.append(frame[key][:, :2])  # Get only xy
+        # Collect all frames for this landmark type into one (F, K, 2) array
+        trajectories = [frame[key] for frame in sig['frames'] if frame.get(key) is not None]
         
         if not trajectories:
             print(f"  No data")
             continue
         
+        trajectories = np.ascontiguousarray(np.asarray(trajectories, dtype=np.float32)[:, :, :2])  # Get only xy
+        
         # Analyze each landmark
-        num_landmarks = trajectories[0].shape[0] if len(trajectories) > 0 else 0
+        num_landmarks = trajectories.shape[1]
         print(f"  Landmarks per frame: {num_landmarks}")
         
-        # Compute velocity for each landmark
-        for lm_idx in range(min(3, num_landmarks)):  # Just check first 3 landmarks
-            velocities = []
-            for i in range(1, len(trajectories)):
-                diff = trajectories[i][lm_idx] - trajectories[i-1][lm_idx]
-                vel = np.linalg.norm(diff)
-                velocities.append(vel)
-            
-            velocities = np.array(velocities)
+        # Velocity of every checked landmark at once: (F-1, n) frame-to-frame distances
+        checked = min(3, num_landmarks)  # Just check first 3 landmarks
+        all_velocities = np.linalg.norm(np.diff(trajectories[:, :checked], axis=0), axis=2)
+        
+        for lm_idx in range(checked):
+            velocities = all_velocities[:, lm_idx]
             
             # Compute jerk (change in velocity)
             jerks = np.diff(velocities)
@@ -14,23 +14,38 @@ def compute_embeddings_from_signature(sig_path, engine):
     with open(sig_path, 'r') as f:
         sig = json.load(f)
     
-    # Extract all pose landmarks
-    all_landmarks = []
-    for frame in sig.get('pose_data', []):
-        pose = np.array(frame.get('pose', []))
-        left_hand = np.array(frame.get('left_hand', []))
-        right_hand = np.array(frame.get('right_hand', []))
-        
-        if pose.size > 0:
-            all_landmarks.append(pose.flatten())
-    
-    if not all_landmarks:
+    # Stack all pose landmarks into one (F, K*D) array
+    poses = [frame['pose'] for frame in sig.get('pose_data', []) if frame.get('pose')]
+    
+    if not poses:
         return None
     
+    all_landmarks = np.array(poses, dtype=float).reshape(len(poses), -1)
+    
     # Average embedding
-    embedding = np.mean(all_landmarks, axis=0)
+    embedding = all_landmarks.mean(axis=0)
     return embedding / np.linalg.norm(embedding)  # Normalize
 
+def mean_point_diffs(orig_frames, smooth_frames, key):
+    """Per-frame mean landmark displacement for frames where both signatures have `key`."""
+    pairs = [(orig[key], smooth[key]) for orig, smooth in zip(orig_frames, smooth_frames)
+             if orig.get(key) and smooth.get(key)]
+    
+    if not pairs:
+        return []
+    
+    try:
+        orig = np.array([o for o, _ in pairs], dtype=float)
+        smooth = np.array([s for _, s in pairs], dtype=float)
+    except ValueError:
+        orig = smooth = None  # Ragged landmark counts across frames
+    
+    if orig is None or orig.ndim != 3 or orig.shape != smooth.shape:
+        return [np.mean(np.linalg.norm(np.array(o) - np.array(s), axis=1)) for o, s in pairs]
+    
+    # (F, K) point distances -> (F,) per-frame means, in one pass
+    return np.linalg.norm(orig - smooth, axis=2).mean(axis=1)
+
 def main():
     parser = argparse.ArgumentParser(description="Compare original vs smoothed signatures")
     parser.add_argument('--lang', default='asl')
@@ -89,25 +104,12 @@ def main():
     
     # Analyze frame-by-frame differences
     print(f"\nFrame-by-frame comparison:")
-    pose_diffs = []
-    hand_diffs = []
-    
-    for i, (orig_frame, smooth_frame) in enumerate(zip(orig_sig['pose_data'], smooth_sig['pose_data'])):
-        if orig_frame.get('pose') and smooth_frame.get('pose'):
-            orig_pose = np.array(orig_frame['pose'])
-            smooth_pose = np.array(smooth_frame['pose'])
-            diff = np.mean(np.linalg.norm(orig_pose - smooth_pose, axis=1))
-            pose_diffs.append(diff)
-        
-        if orig_frame.get('left_hand') and smooth_frame.get('left_hand'):
-            orig_hand = np.array(orig_frame['left_hand'])
-            smooth_hand = np.array(smooth_frame['left_hand'])
-            diff = np.mean(np.linalg.norm(orig_hand - smooth_hand, axis=1))
-            hand_diffs.append(diff)
-    
-    if pose_diffs:
+    pose_diffs = mean_point_diffs(orig_sig['pose_data'], smooth_sig['pose_data'], 'pose')
+    hand_diffs = mean_point_diffs(orig_sig['pose_data'], smooth_sig['pose_data'], 'left_hand')
+    
+    if len(pose_diffs):
         print(f"  Pose - mean diff: {np.mean(pose_diffs):.2f}px, max: {np.max(pose_diffs):.2f}px")
-    if hand_diffs:
+    if len(hand_diffs):
         print(f"  Hands - mean diff: {np.mean(hand_diffs):.2f}px, max: {np.max(hand_diffs):.2f}px")
 
 if __name__ == '__main__':
@@ -19,6 +19,22 @@ FRAME_COUNT = FPS * DURATION
 FRAME_WIDTH = 640
 FRAME_HEIGHT = 480
 
+# Drawing constants (BGR)
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+COLOR_BACKGROUND = (240, 240, 240)  # Light gray
+COLOR_LABEL = (0, 0, 0)
+COLOR_RIGHT_HAND = (0, 0, 255)      # Red
+COLOR_LEFT_HAND = (255, 0, 0)       # Blue
+COLOR_COUNTER = (100, 100, 100)
+HAND_RADIUS = 30
+
+# Simulated hand trajectories for every frame, computed once (identical for
+# every word): one vectorized sin/cos pass instead of per-frame scalar math
+_PHASE = np.arange(FRAME_COUNT) / 10
+_SIN, _COS = np.sin(_PHASE), np.cos(_PHASE)
+RIGHT_HAND_PATH = np.stack([200 + 100 * _SIN, 250 + 80 * _COS], axis=1).astype(int).tolist()
+LEFT_HAND_PATH = np.stack([400 + 100 * _COS, 250 + 80 * _SIN], axis=1).astype(int).tolist()
+
 print("=" * 60)
 print("Test Video Generator")
 print("=" * 60)
@@ -37,27 +53,29 @@ for word in TARGET_WORDS:
     fourcc = cv2.VideoWriter_fourcc(*'mp4v')
     out = cv2.VideoWriter(str(filename), fourcc, FPS, (FRAME_WIDTH, FRAME_HEIGHT))
     
+    # Static background (gray + word label) is the same for every frame: draw once
+    background = np.zeros((FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
+    background[:] = COLOR_BACKGROUND
+    cv2.putText(background, word, (50, 100), FONT, 2, COLOR_LABEL, 3)
+    
+    # One frame buffer reused for every frame (VideoWriter.write copies it)
+    frame = np.empty_like(background)
+    
     # Generate frames with moving elements to simulate sign language
     for frame_idx in range(FRAME_COUNT):
-        # Create blank frame
-        frame = np.zeros((FRAME_HEIGHT, FRAME_WIDTH, 3), dtype=np.uint8)
-        frame[:] = (240, 240, 240)  # Light gray background
-        
-        # Add text label
-        cv2.putText(frame, word, (50, 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
+        # Start from the pre-rendered background
+        np.copyto(frame, background)
         
         # Add moving circles to simulate hand movement
-        x = int(200 + 100 * np.sin(frame_idx / 10))
-        y = int(250 + 80 * np.cos(frame_idx / 10))
-        cv2.circle(frame, (x, y), 30, (0, 0, 255), -1)  # Right hand (red)
+        x, y = RIGHT_HAND_PATH[frame_idx]
+        cv2.circle(frame, (x, y), HAND_RADIUS, COLOR_RIGHT_HAND, -1)
         
-        x2 = int(400 + 100 * np.cos(frame_idx / 10))
-        y2 = int(250 + 80 * np.sin(frame_idx / 10))
-        cv2.circle(frame, (x2, y2), 30, (255, 0, 0), -1)  # Left hand (blue)
+        x2, y2 = LEFT_HAND_PATH[frame_idx]
+        cv2.circle(frame, (x2, y2), HAND_RADIUS, COLOR_LEFT_HAND, -1)
         
         # Add frame counter
         cv2.putText(frame, f"Frame: {frame_idx + 1}/{FRAME_COUNT}", (20, 450), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (100, 100, 100), 2)
+                   FONT, 0.7, COLOR_COUNTER, 2)
         
         out.write(frame)
     
@@ -20,6 +20,7 @@ Result:
 
 import json
 import numpy as np
+from scipy.spatial.distance import cosine
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import os
@@ -268,8 +269,6 @@ class EmbeddingGenerator:
         print("📈 ASL-BSL Similarity Analysis")
         print("=" * 60)
         
-        from scipy.spatial.distance import cosine
-        
         concepts = []
         asl_embeddings = []
         bsl_embeddings = []
@@ -30,11 +30,11 @@ import os
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import deque
-from dataclasses import dataclass
 import sys
 
 # Import registry loader for new multi-language structure
 from utils.registry_loader import RegistryLoader
+from utils.dataclass_slots import slotted_dataclass
 
 # ============================================================================
 # CONFIGURATION
@@ -60,7 +60,7 @@ COLOR_GHOST = (100, 100, 100) # Faint grey for golden signature
 COLOR_MATCHED = (0, 255, 255) # Cyan for matched concept
 
 
-@dataclass
+@slotted_dataclass
 class RecognitionResult:
     """Result of a recognition attempt."""
     concept_name: str
@@ -84,6 +84,14 @@ class RecognitionEngine:
         self.concept_registry = self.loader.get_concept_registry()
         self.asl_registry = self.loader.get_language_registry('asl')
         self.embeddings = self._load_embeddings()
+        # L2-normalized (N, D) matrix: cosine for all concepts is one dot product
+        self._emb_names = list(self.embeddings)
+        self._emb_matrix = None
+        if self._emb_names:
+            self._emb_matrix = np.ascontiguousarray(
+                np.stack([self.embeddings[n] for n in self._emb_names]), dtype=np.float32
+            )
+            self._emb_matrix /= np.linalg.norm(self._emb_matrix, axis=1, keepdims=True) + 1e-12
         self.landmark_window = deque(maxlen=WINDOW_SIZE)
         self.mp_holistic = mp.solutions.holistic
         self.mp_drawing = mp.solutions.drawing_utils
@@ -211,24 +219,28 @@ class RecognitionEngine:
         if live_embedding is None:
             return None
         
-        # Score against all concepts via Cosine Similarity
-        from scipy.spatial.distance import cosine
+        if self._emb_matrix is None:
+            return None
         
-        scores = {}
-        for concept_name, stored_embedding in self.embeddings.items():
-            # Cosine similarity = 1 - cosine distance
-            similarity = 1 - cosine(live_embedding, stored_embedding)
-            scores[concept_name] = similarity
+        # Score against all concepts via Cosine Similarity (normalized GEMV)
+        names = self._emb_names
+        sims = self._emb_matrix @ live_embedding.astype(np.float32)
+        sims /= float(np.linalg.norm(live_embedding)) + 1e-12
+        scores = dict(zip(names, sims.tolist()))
         
-        # Sort by score
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        best_concept, best_score = sorted_scores[0]
+        # Top-2 by score (O(N) selection, no full sort)
+        if len(sims) > 1:
+            top2 = np.argpartition(sims, -2)[-2:]
+            top2 = top2[np.argsort(sims[top2])[::-1]]
+        else:
+            top2 = np.array([0])
+        best_concept, best_score = names[top2[0]], float(sims[top2[0]])
         
         # Tier 4: Cross-concept validation
         if best_score < COSINE_SIM_THRESHOLD:
             status = "low_confidence"
-        elif len(sorted_scores) > 1:
-            second_concept, second_score = sorted_scores[1]
+        elif len(top2) > 1:
+            second_score = float(sims[top2[1]])
             gap = best_score - second_score
             
             if gap < TIER_4_GAP_THRESHOLD:
@@ -27,22 +27,24 @@ Command Reference:
     r = reset landmark window
 """
 
+import asyncio
 import cv2
 import numpy as np
 import json
+import hashlib
 import mediapipe as mp
 import os
 import sys
 import time
+import queue
 import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from scipy.spatial.distance import cosine
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Import registry loader for new multi-language structure
 from utils.registry_loader import RegistryLoader
+from utils.dataclass_slots import slotted_dataclass
 
 # Socket.io optional import
 try:
@@ -52,6 +54,13 @@ except ImportError:
     HAS_SOCKETIO = False
     print("⚠️  Socket.io not installed. Install with: pip install python-socketio")
 
+# SimSIMD optional import (SIMD cosine kernels; NumPy GEMV fallback)
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -59,18 +68,42 @@ except ImportError:
 TRANSLATION_REGISTRY = "translation_map.json"
 EMBEDDINGS_DIR = "assets/embeddings"
 SIGNATURES_DIR = "assets/signatures"
+CACHE_DIR = ".cache"  # Repo-local derived data (safe to delete)
 
 # Recognition parameters
 COSINE_SIM_THRESHOLD = 0.80
 TIER_4_GAP_THRESHOLD = 0.15
-WINDOW_SIZE = 30
+WINDOW_SIZE = 30  # Camera frames pooled per embedding
+TEMPORAL_MIN_FRAMES = 5  # Camera frames above threshold before a match is confirmed
+EMBEDDING_DIM = 512  # Pooled features are zero-padded to this length
 CONFIDENCE_DISPLAY_THRESHOLD = 0.50
 DEFAULT_COOLDOWN_MS = 2000  # Prevent double-counting
+DASHBOARD_EVERY = 3  # Redraw confidence bars every Nth frame (cached in between)
+DASHBOARD_PANEL_WIDTH = 420  # Width of the cached confidence bar panel (px, bars + labels)
+FULL_SCORE_EVERY = 3  # Fast track: full concept scan at least every Nth frame
+EMIT_QUEUE_SIZE = 32  # Pending Socket.io emits before new ones are dropped
+GOLDEN_LOAD_WORKERS = 8  # Threads for loading golden signatures at startup
+DEFAULT_RECOGNIZE_EVERY = 2  # Run MediaPipe + scoring on every Nth camera frame
+MAX_DROPOUT_REUSE = 5  # Frames the last result is reused while landmarks drop out
+
+# Temporal redundancy skip (static camera): compare 80x60 grayscale thumbnails
+REDUNDANCY_THUMB_SIZE = (80, 60)
+REDUNDANCY_PIXEL_TAU = 8  # Per-pixel absdiff below this counts as unchanged
+REDUNDANCY_RATIO = 0.98  # Fraction of unchanged pixels to treat frame as redundant
+MAX_REDUNDANT_SKIPS = 3  # Force a full recognize after this many skipped frames
+                         # (skipped frames do not advance the window or temporal filter)
 
 # Landmark indices
 SHOULDER_LEFT = 11
 SHOULDER_RIGHT = 12
 
+# Per-frame feature layout: pose (6) + left hand (21) + right hand (21) + face (4)
+NUM_FRAME_LANDMARKS = 52
+FACE_LANDMARK_IDS = (0, 33, 263, 13)  # nose, left eye, right eye, mouth
+
+# Simplified pose connections for the ghost skeleton (indices into first 6 pose points)
+GHOST_CONNECTIONS = np.array([(0, 1), (0, 2), (1, 3), (2, 4)], dtype=np.intp)
+
 # UI Colors
 COLOR_LIVE = (0, 255, 0)           # Green: live skeleton
 COLOR_GHOST = (100, 100, 100)      # Grey: golden signature
@@ -80,6 +113,16 @@ COLOR_BAR_HIGH = (0, 255, 0)       # Green: high
 COLOR_MATCH = (0, 255, 255)        # Cyan: matched
 COLOR_TEXT = (255, 255, 255)       # White: text
 
+# Confidence bar color lookup: np.digitize(score, CONFIDENCE_BINS) -> row
+CONFIDENCE_BINS = np.array([0.20, 0.50, 0.80, 0.90], dtype=np.float32)
+COLOR_LUT = np.array([
+    COLOR_BAR_LOW,   # < 0.20: red for very low
+    (0, 100, 200),   # 0.20+: light orange for low
+    COLOR_BAR_MED,   # 0.50+: orange for medium
+    (0, 200, 100),   # 0.80+: dark green for medium-high
+    COLOR_BAR_HIGH,  # 0.90+: green for high score
+], dtype=np.uint8)
+
 
 # ============================================================================
 # TEMPORAL SMOOTHING FILTER (Hysteresis for Stable Recognition)
@@ -102,7 +145,9 @@ class TemporalFilter:
         """
         self.min_frames = min_frames
         self.threshold = threshold
-        self.frame_count = defaultdict(int)
+        # Only the last concept can have a non-zero run, so a single counter
+        # replaces the per-concept dict (no allocation or hashing per frame)
+        self.count = 0
         self.last_concept = None
         self.confirmed_concept = None
     
@@ -116,20 +161,18 @@ class TemporalFilter:
         if similarity >= self.threshold:
             # Same concept as last frame: increment counter
             if best_concept == self.last_concept:
-                self.frame_count[best_concept] += 1
+                self.count += 1
             else:
-                # Concept changed: reset counters
-                self.frame_count = defaultdict(int)
-                self.frame_count[best_concept] = 1
+                # Concept changed: reset counter
+                self.count = 1
             
             # Check if confirmed
-            if self.frame_count[best_concept] >= self.min_frames:
+            if self.count >= self.min_frames:
                 self.confirmed_concept = best_concept
                 return best_concept
         else:
             # Below threshold: reset
-            if self.last_concept:
-                self.frame_count[self.last_concept] = 0
+            self.count = 0
             self.confirmed_concept = None
         
         self.last_concept = best_concept
@@ -137,7 +180,7 @@ class TemporalFilter:
     
     def reset(self):
         """Reset filter state."""
-        self.frame_count = defaultdict(int)
+        self.count = 0
         self.last_concept = None
         self.confirmed_concept = None
 
@@ -146,14 +189,15 @@ class TemporalFilter:
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@slotted_dataclass
 class RecognitionResult:
     """Encapsulates recognition output."""
+    # Allocated every frame: slots avoid a per-instance __dict__
     concept: Optional[str]
     similarity_score: float
     confidence_level: str
     verification_status: str
-    all_scores: Dict[str, float]
+    all_scores: np.ndarray  # float32 similarity per concept, ordered as concept_names
     bsl_target_file: Optional[str]
     gap_to_second: float
     frame_window_complete: bool
@@ -172,6 +216,8 @@ class RecognitionEngineUI:
         debug: bool = False,
         socket_url: Optional[str] = None,
         cooldown_ms: int = DEFAULT_COOLDOWN_MS,
+        quantized: bool = False,
+        fast_track: bool = False,
     ):
         """
         Initialize engine.
@@ -181,6 +227,9 @@ class RecognitionEngineUI:
             debug: Enable debug visualization
             socket_url: Socket.io server URL (e.g., http://localhost:5000)
             cooldown_ms: Milliseconds to wait after match before next emission
+            quantized: Score against int8-quantized embeddings (approximate)
+            fast_track: Re-score only the concept being confirmed between full scans
+                (approximate: other concepts' scores and the gap go stale)
         """
         self.debug = debug
         self.registry_path = registry_path
@@ -189,20 +238,48 @@ class RecognitionEngineUI:
         self.asl_registry = self.loader.get_language_registry('asl')
         self.bsl_registry = self.loader.get_language_registry('bsl')
         self.registry = {}  # Legacy compatibility
-        self.embeddings = {}
         self.concept_names = []
         self.cooldown_ms = cooldown_ms
 
+        # Socket.io metadata per concept: (concept_name, bsl_target_path)
+        self._emit_meta: Dict[str, Tuple[str, str]] = {}
+        for concept_id, concept_data in self.concept_registry.items():
+            if concept_id.startswith('_') or not isinstance(concept_data, dict):
+                continue
+            bsl_target = concept_data.get("bsl_target_file")
+            self._emit_meta[concept_id] = (
+                concept_data.get("concept_name", concept_id),
+                str(bsl_target) if bsl_target else "",
+            )
+
         # Socket.io setup
         self.socket_url = socket_url
         self.sio = None
         self.socket_connected = False
+        self._loop = None  # asyncio loop (own thread) driving the AsyncClient
+        self._emit_slots = threading.BoundedSemaphore(EMIT_QUEUE_SIZE)
         self._setup_socket_io()
 
         # Temporal smoothing filter (5 frames @ 0.80+)
-        self.temporal_filter = TemporalFilter(min_frames=5, threshold=0.80)
-
-        # Cooldown state machine
+        self.temporal_filter = TemporalFilter(min_frames=TEMPORAL_MIN_FRAMES, threshold=0.80)
+
+        # Fast track: while the filter is counting frames for a concept, only
+        # that concept is re-scored (full scan every FULL_SCORE_EVERY frames)
+        self._fast_track = fast_track
+        self._scored_frames = 0
+        self._last_scores = np.zeros(0, dtype=np.float32)
+        self._last_second_score = 0.0
+
+        # Result cache: window version counter (bumped on every append), so a
+        # frame that does not advance the window reuses the last result
+        self._window_version = 0
+        self._last_scored_version = -1
+        self._last_result = None
+        self._dropout_frames = 0
+        self._state_lock = threading.Lock()  # Guards window/filter state (worker vs 'r' reset)
+
+        # Cooldown state machine (monotonic clock, nanoseconds)
+        self._cooldown_ns = cooldown_ms * 1_000_000
         self.last_match_time = 0
         self.last_matched_concept = None
 
@@ -219,12 +296,45 @@ class RecognitionEngineUI:
 
         # Sliding window
         self.landmark_window = []
-        self.golden_signatures = {}  # Cached golden poses
+        self._live_buf = np.zeros(EMBEDDING_DIM, dtype=np.float32)  # Pooled embedding (reused)
+        self._lm_buf = np.zeros((NUM_FRAME_LANDMARKS, 3), dtype=np.float32)  # Per-frame landmarks (reused)
+        self._rgb_buf = None  # RGB conversion target for MediaPipe (reused)
+        self.window_size = WINDOW_SIZE  # Detections per window (scaled by _set_stride)
+        self._window_buf = np.empty((WINDOW_SIZE, NUM_FRAME_LANDMARKS, 3), dtype=np.float32)  # Stacked window (reused)
+        self.golden_signatures = {}  # Golden pose (K, 2) float32 (x, y) arrays for ghost skeleton
 
         # Load data
         self._load_embeddings()
         self._load_golden_signatures()
 
+        self._concept_index = {name: i for i, name in enumerate(self.concept_names)}
+
+        # Optional int8 scoring: per-row symmetric quantization to [-127, 127]
+        self.quantized = quantized
+        if quantized:
+            scale = 127.0 / (np.max(np.abs(self._emb_matrix), axis=1, keepdims=True) + 1e-12)
+            self._emb_i8 = np.round(self._emb_matrix * scale).astype(np.int8)
+            self._emb_scale = (1.0 / scale).astype(np.float32).ravel()
+        self._sims_buf = np.empty(len(self.concept_names), dtype=np.float32)
+        self._no_scores = np.zeros(len(self.concept_names), dtype=np.float32)  # Before a full window
+
+        # Dashboard throttling: cached confidence bar panel layers (no camera pixels)
+        self._frame_no = 0
+        self._last_overlay = None
+        self._last_overlay_key = None
+
+        # Pre-rendered dashboard text (static labels drawn once, blitted per frame)
+        self._title_sprite = self._render_text_sprite(
+            "CONFIDENCE SCORES", cv2.FONT_HERSHEY_SIMPLEX, 0.7, COLOR_TEXT, 2
+        )
+        self._label_sprites = {}
+        for concept in self.concept_names:
+            label = f"{concept[:8]:8s} "
+            self._label_sprites[concept] = (
+                self._render_text_sprite(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, COLOR_TEXT, 1),
+                self._render_text_sprite(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2),
+            )
+
         print(f"✅ Engine initialized")
         print(f"   Concepts: {len(self.concept_names)}")
         print(f"   Debug: {'ON' if self.debug else 'OFF'}")
@@ -232,6 +342,7 @@ class RecognitionEngineUI:
             f"   Socket.io: {'ENABLED' if socket_url and HAS_SOCKETIO else 'DISABLED'}"
         )
         print(f"   Cooldown: {cooldown_ms}ms")
+        print(f"   Scoring: {'SimSIMD' if HAS_SIMSIMD else 'NumPy'}{' (int8)' if quantized else ''}")
 
     def _setup_socket_io(self):
         """Setup Socket.io client (optional)."""
@@ -239,34 +350,57 @@ class RecognitionEngineUI:
             return
 
         try:
-            self.sio = socketio.Client(reconnection=True, reconnection_attempts=5)
+            self.sio = socketio.AsyncClient(reconnection=True, reconnection_attempts=5)
 
             @self.sio.on("connect")
-            def on_connect():
+            async def on_connect():
                 self.socket_connected = True
                 print(f"✅ Socket.io connected to {self.socket_url}")
 
             @self.sio.on("disconnect")
-            def on_disconnect():
+            async def on_disconnect():
                 self.socket_connected = False
                 print(f"⚠️  Socket.io disconnected")
 
-            # Connect in background thread
+            # Event loop in a background thread: connect + emits are scheduled
+            # onto it, so network I/O never blocks the recognition loop
+            self._loop = asyncio.new_event_loop()
             threading.Thread(
-                target=self._connect_socket, daemon=True
+                target=self._loop.run_forever, daemon=True
             ).start()
+            asyncio.run_coroutine_threadsafe(self._connect_socket(), self._loop)
         except Exception as e:
             print(f"❌ Socket.io setup failed: {e}")
 
-    def _connect_socket(self):
-        """Connect to Socket.io server (background thread)."""
+    async def _connect_socket(self):
+        """Connect to Socket.io server (runs on the asyncio loop)."""
         try:
-            self.sio.connect(self.socket_url)
+            await self.sio.connect(self.socket_url)
         except Exception as e:
             print(f"⚠️  Failed to connect Socket.io: {e}")
 
+    async def _emit_events(self, events: List[Tuple[str, dict]]):
+        """Send (event, payload) pairs in order (runs on the asyncio loop)."""
+        try:
+            for event, payload in events:
+                await self.sio.emit(event, payload)
+        except Exception as e:
+            print(f"⚠️  Socket.io emit failed: {e}")
+        finally:
+            self._emit_slots.release()
+
     def _load_embeddings(self):
-        """Load ASL embeddings from ASL registry."""
+        """
+        Load ASL embeddings from ASL registry.
+
+        Embeddings are stored as one L2-normalized, C-contiguous (N, D)
+        float32 matrix with rows parallel to self.concept_names, so cosine
+        similarity for all concepts is a single matrix-vector product.
+        The matrix is cached in CACHE_DIR (one file per language, replaced
+        atomically) together with a key over every embedding file's path,
+        mtime and size, so later launches skip the load + normalize.
+        """
+        sources = []  # (concept_name, emb_file, stat)
         for concept_id, concept_data in self.asl_registry.items():
             if concept_id.startswith('_'):
                 continue
@@ -276,15 +410,53 @@ class RecognitionEngineUI:
                 continue
 
             try:
-                embedding = np.load(emb_file)
-                concept_name = concept_data.get("concept_name")
-                self.embeddings[concept_name] = embedding
-                self.concept_names.append(concept_name)
+                sources.append((concept_data.get("concept_name"), emb_file, os.stat(emb_file)))
             except FileNotFoundError:
                 print(f"⚠️  Embedding not found: {emb_file}")
 
+        key_src = "|".join(
+            f"{name}:{emb_file}:{st.st_mtime_ns}:{st.st_size}" for name, emb_file, st in sources
+        )
+        key = hashlib.sha1(key_src.encode()).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, "asl_embeddings.npz")
+
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    if str(cached["key"]) == key:
+                        self._emb_matrix = np.ascontiguousarray(cached["matrix"], dtype=np.float32)
+                        self.concept_names.extend(cached["names"].tolist())
+                        self._emb_names = self.concept_names
+                        return
+            except (OSError, KeyError, ValueError):
+                self.concept_names.clear()
+
+        rows = []
+        for concept_name, emb_file, _ in sources:
+            rows.append(np.load(emb_file))
+            self.concept_names.append(concept_name)
+
+        if not rows:
+            self._emb_matrix = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+            self._emb_names = self.concept_names
+            return
+
+        self._emb_matrix = np.ascontiguousarray(np.stack(rows), dtype=np.float32)
+        self._emb_matrix /= np.linalg.norm(self._emb_matrix, axis=1, keepdims=True) + 1e-12
+        self._emb_names = self.concept_names
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, key=np.array(key), matrix=self._emb_matrix,
+                     names=np.array(self.concept_names))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not write embedding cache: {e}")
+
     def _load_golden_signatures(self):
         """Preload golden signature poses for ghost skeleton from ASL registry."""
+        pairs = []  # (concept_name, sig_file)
         for concept_id, concept_data in self.asl_registry.items():
             if concept_id.startswith('_'):
                 continue
@@ -300,18 +472,91 @@ class RecognitionEngineUI:
             if not sig_file:
                 continue
 
+            pairs.append((concept_data.get("concept_name"), sig_file))
+
+        # Signature files are independent: overlap the reads + parses
+        with ThreadPoolExecutor(max_workers=GOLDEN_LOAD_WORKERS) as ex:
+            frames = list(ex.map(self._load_golden_frame, (sig_file for _, sig_file in pairs)))
+
+        # Pre-extract first 6 pose landmarks as (x, y), once, for the ghost overlay
+        for (concept_name, _), golden_pose in zip(pairs, frames):
             try:
-                with open(sig_file) as f:
-                    data = json.load(f)
-                    # Extract first frame's pose (has highest detail)
-                    if isinstance(data, dict) and "frames" in data:
-                        concept_name = concept_data.get("concept_name")
-                        self.golden_signatures[concept_name] = data["frames"][0]
-                    elif isinstance(data, list) and len(data) > 0:
-                        concept_name = concept_data.get("concept_name")
-                        self.golden_signatures[concept_name] = data[0]
+                pose_landmarks = golden_pose.get("pose_landmarks", []) if golden_pose else []
+                if pose_landmarks:
+                    self.golden_signatures[concept_name] = np.array(
+                        [[lm["x"], lm["y"]] for lm in pose_landmarks[:6]], dtype=np.float32
+                    )
             except Exception:
-                pass  # Silent fail for missing signatures
+                pass  # Silent fail for malformed signatures
+
+    @staticmethod
+    def _load_golden_frame(sig_file: str) -> Optional[dict]:
+        """Load the first frame of a signature file (None if missing/unreadable)."""
+        try:
+            with open(sig_file) as f:
+                data = json.load(f)
+            # Extract first frame's pose (has highest detail)
+            if isinstance(data, dict) and "frames" in data:
+                return data["frames"][0]
+            elif isinstance(data, list) and len(data) > 0:
+                return data[0]
+        except Exception:
+            pass  # Silent fail for missing signatures
+        return None
+
+    @staticmethod
+    def _fill_rect(frame: np.ndarray, x0: int, y0: int, x1: int, y1: int, color: Tuple):
+        """Fill an axis-aligned box via slice assignment (same pixels as cv2.rectangle(..., -1))."""
+        if x1 < x0:
+            x0, x1 = x1, x0
+        if y1 < y0:
+            y0, y1 = y1, y0
+        frame[max(y0, 0):max(y1 + 1, 0), max(x0, 0):max(x1 + 1, 0)] = color
+
+    @staticmethod
+    def _render_text_sprite(text: str, font: int, font_scale: float,
+                            color: Tuple, thickness: int) -> Tuple:
+        """
+        Rasterize text once into a small sprite for repeated blitting.
+
+        Returns:
+            (inv_alpha, premult, ascent, pad, advance) where alpha is the glyph
+            coverage, premult is color * alpha, and advance is how far
+            cv2.putText moves the origin (for placing text after the sprite)
+        """
+        (text_w, text_h), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+        pad = thickness
+        coverage = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        cv2.putText(coverage, text, (pad, pad + text_h), font, font_scale, 255, thickness)
+        alpha = (coverage.astype(np.float32) / 255.0)[:, :, np.newaxis]
+        premult = alpha * np.array(color, dtype=np.float32)
+        # getTextSize's width includes the stroke thickness; putText's advance does not
+        return 1.0 - alpha, premult, text_h, pad, text_w - thickness
+
+    @staticmethod
+    def _blit_sprite(frame: np.ndarray, sprite_data: Tuple, x: int, y: int) -> int:
+        """
+        Draw a pre-rendered text sprite with its baseline origin at (x, y).
+
+        Blends by glyph coverage, like cv2.putText at the same origin.
+        Returns the text advance.
+        """
+        inv_alpha, premult, ascent, pad, advance = sprite_data
+        h, w = frame.shape[:2]
+        top, left = y - ascent - pad, x - pad
+        y0, x0 = max(top, 0), max(left, 0)
+        y1 = min(top + inv_alpha.shape[0], h)
+        x1 = min(left + inv_alpha.shape[1], w)
+        if y1 <= y0 or x1 <= x0:
+            return advance
+
+        sy, sx = slice(y0 - top, y1 - top), slice(x0 - left, x1 - left)
+        roi = frame[y0:y1, x0:x1]
+        blended = roi * inv_alpha[sy, sx]
+        blended += premult[sy, sx]
+        blended += 0.5  # Round to nearest on the uint8 cast
+        np.copyto(roi, blended, casting="unsafe")
+        return advance
 
     def _normalize_landmarks(self, landmarks: np.ndarray) -> np.ndarray:
         """Body-centric normalization (subtract shoulder center)."""
@@ -320,105 +565,199 @@ class RecognitionEngineUI:
 
     def _extract_frame_features(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """Extract 52 landmarks from frame."""
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.holistic.process(rgb)
+        # Convert into a reused RGB buffer (reallocated only if frame size changes)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        self._rgb_buf.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        self._rgb_buf.flags.writeable = False  # Lets MediaPipe skip its input copy
+        results = self.holistic.process(self._rgb_buf)
 
         if not results.pose_landmarks:
             return None
 
-        landmarks = []
+        buf = self._lm_buf
 
         # Pose (6 points)
-        if results.pose_landmarks:
-            for lm in results.pose_landmarks.landmark[:6]:
-                landmarks.append([lm.x, lm.y, lm.z if hasattr(lm, "z") else 0.0])
+        for i, lm in enumerate(results.pose_landmarks.landmark[:6]):
+            buf[i, 0] = lm.x
+            buf[i, 1] = lm.y
+            buf[i, 2] = lm.z if hasattr(lm, "z") else 0.0
 
         # Left hand (21 points)
         if results.left_hand_landmarks:
-            for lm in results.left_hand_landmarks.landmark:
-                landmarks.append([lm.x, lm.y, lm.z])
+            for i, lm in enumerate(results.left_hand_landmarks.landmark, 6):
+                buf[i, 0] = lm.x
+                buf[i, 1] = lm.y
+                buf[i, 2] = lm.z
         else:
-            landmarks.extend([[0, 0, 0]] * 21)
+            buf[6:27] = 0
 
         # Right hand (21 points)
         if results.right_hand_landmarks:
-            for lm in results.right_hand_landmarks.landmark:
-                landmarks.append([lm.x, lm.y, lm.z])
+            for i, lm in enumerate(results.right_hand_landmarks.landmark, 27):
+                buf[i, 0] = lm.x
+                buf[i, 1] = lm.y
+                buf[i, 2] = lm.z
         else:
-            landmarks.extend([[0, 0, 0]] * 21)
+            buf[27:48] = 0
 
         # Face (4 points: nose, left eye, right eye, mouth)
         if results.face_landmarks:
-            for idx in [0, 33, 263, 13]:
-                lm = results.face_landmarks.landmark[idx]
-                landmarks.append([lm.x, lm.y, lm.z])
+            face = results.face_landmarks.landmark
+            for i, idx in enumerate(FACE_LANDMARK_IDS, 48):
+                lm = face[idx]
+                buf[i, 0] = lm.x
+                buf[i, 1] = lm.y
+                buf[i, 2] = lm.z
         else:
-            landmarks.extend([[0, 0, 0]] * 4)
+            buf[48:52] = 0
 
-        landmarks = np.array(landmarks)
-        return self._normalize_landmarks(landmarks)
+        # Normalization returns a new array, so the buffer is safe to reuse
+        return self._normalize_landmarks(buf)
 
     def _compute_live_embedding(self) -> Optional[np.ndarray]:
-        """Compute embedding from landmark window."""
-        if len(self.landmark_window) < WINDOW_SIZE:
-            return None
+        """
+        Compute embedding from landmark window.
 
-        window_stack = np.array(self.landmark_window[-WINDOW_SIZE:])
-        window_flat = window_stack.reshape(WINDOW_SIZE, -1)
-        embedding = np.mean(window_flat, axis=0)
+        Pools into a preallocated buffer (padding stays zero); the returned
+        array is overwritten on the next call.
+        """
+        if len(self.landmark_window) < self.window_size:
+            return None
 
-        if len(embedding) < 512:
-            embedding = np.pad(embedding, (0, 512 - len(embedding)))
+        window_stack = np.stack(self.landmark_window[-self.window_size:], out=self._window_buf)
+        window_flat = window_stack.reshape(self.window_size, -1)[:, :EMBEDDING_DIM]
+        np.mean(window_flat, axis=0, out=self._live_buf[:window_flat.shape[1]])
 
-        return embedding[:512]
+        return self._live_buf
 
     def recognize(self, frame: np.ndarray) -> RecognitionResult:
         """Main recognition method."""
         landmarks = self._extract_frame_features(frame)
         if landmarks is None:
+            # Brief dropout: window unchanged, so the last result still holds
+            # (never a verified one: that would re-emit after the hands left)
+            if (
+                self._last_result is not None
+                and self._last_result.verification_status != "verified"
+                and self._last_scored_version == self._window_version
+                and self._dropout_frames < MAX_DROPOUT_REUSE
+            ):
+                self._dropout_frames += 1
+                return self._last_result
             return RecognitionResult(
                 concept=None,
                 similarity_score=0.0,
                 confidence_level="low",
                 verification_status="low_confidence",
-                all_scores={},
+                all_scores=self._no_scores,
                 bsl_target_file=None,
                 gap_to_second=0.0,
                 frame_window_complete=False,
             )
 
         self.landmark_window.append(landmarks)
-        if len(self.landmark_window) > WINDOW_SIZE:
+        if len(self.landmark_window) > self.window_size:
             self.landmark_window.pop(0)
+        self._window_version += 1
+        self._dropout_frames = 0
 
-        if len(self.landmark_window) < WINDOW_SIZE:
+        if len(self.landmark_window) < self.window_size:
             return RecognitionResult(
                 concept=None,
                 similarity_score=0.0,
                 confidence_level="low",
                 verification_status="low_confidence",
-                all_scores={},
+                all_scores=self._no_scores,
                 bsl_target_file=None,
                 gap_to_second=0.0,
                 frame_window_complete=False,
             )
 
+        result = self._score_window()
+        self._last_result = result
+        self._last_scored_version = self._window_version
+        return result
+
+    def _score_window(self) -> RecognitionResult:
+        """Score the current (full) landmark window against all concepts."""
+        # Normalize in place: cosine against E_norm is then a plain dot product
         live_embedding = self._compute_live_embedding()
+        live_embedding /= float(np.linalg.norm(live_embedding)) + 1e-12
+        self._scored_frames += 1
+
+        if self.quantized:
+            live_scale = 127.0 / (float(np.max(np.abs(live_embedding))) + 1e-12)
+            live_i8 = np.round(live_embedding * live_scale).astype(np.int8)
+
+        # Fast track: user is holding a sign the filter is already counting
+        active_concept = self.temporal_filter.last_concept
+        if (
+            self._fast_track
+            and active_concept is not None
+            and self.temporal_filter.count > 0
+            and self._scored_frames % FULL_SCORE_EVERY != 0
+        ):
+            active_idx = self._concept_index[active_concept]
+            # Same arithmetic as the full scan below, so both paths agree
+            if self.quantized and HAS_SIMSIMD:
+                candidate_sim = 1.0 - float(simsimd.cosine(self._emb_i8[active_idx], live_i8))
+            elif self.quantized:
+                dot = int(np.dot(self._emb_i8[active_idx].astype(np.int32), live_i8.astype(np.int32)))
+                candidate_sim = dot * float(self._emb_scale[active_idx]) / live_scale
+            else:
+                candidate_sim = float(np.dot(self._emb_matrix[active_idx], live_embedding))
+            if candidate_sim >= self.temporal_filter.threshold:
+                # Other concepts keep their scores from the last full scan
+                scores = self._last_scores.copy()
+                scores[active_idx] = candidate_sim
+                return self._build_result(
+                    active_concept, candidate_sim,
+                    candidate_sim - self._last_second_score, scores,
+                )
 
-        # Score all concepts
-        scores = {}
-        for concept in self.concept_names:
-            stored_embedding = self.embeddings[concept]
-            cosine_dist = cosine(live_embedding, stored_embedding)
-            cosine_sim = 1 - cosine_dist
-            scores[concept] = cosine_sim
-
-        # Tier 4 validation
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        best_concept, best_score = sorted_scores[0]
-        second_concept, second_score = sorted_scores[1] if len(sorted_scores) > 1 else (None, 0.0)
+        # Score all concepts: cosine = E_norm @ (live / ||live||)
+        if self.quantized:
+            if HAS_SIMSIMD:
+                cos_dist = np.asarray(
+                    simsimd.cdist(live_i8[np.newaxis, :], self._emb_i8, metric="cosine")
+                )[0]
+                sims = np.subtract(1.0, cos_dist, out=self._sims_buf)
+            else:
+                dots = np.matmul(self._emb_i8, live_i8, dtype=np.int32)
+                np.multiply(dots, self._emb_scale, out=self._sims_buf)
+                sims = self._sims_buf
+                sims *= 1.0 / live_scale
+        elif HAS_SIMSIMD:
+            cos_dist = np.asarray(
+                simsimd.cdist(live_embedding[np.newaxis, :], self._emb_matrix, metric="cosine")
+            )[0]
+            sims = np.subtract(1.0, cos_dist, out=self._sims_buf)
+        else:
+            # Plain matmul (BLAS GEMV): faster here than einsum, even with a cached path
+            sims = np.matmul(self._emb_matrix, live_embedding, out=self._sims_buf)
+        scores = sims.copy()  # _sims_buf is reused; results may be cached
+
+        # Tier 4 validation: top-2 selection (O(N), no full sort)
+        if len(sims) > 1:
+            top2 = np.argpartition(sims, -2)[-2:]
+            second_idx, best_idx = top2 if sims[top2[1]] >= sims[top2[0]] else top2[::-1]
+            second_score = float(sims[second_idx])
+        else:
+            best_idx = 0
+            second_score = 0.0
+        best_concept = self.concept_names[best_idx]
+        best_score = float(sims[best_idx])
         gap_to_second = best_score - second_score
 
+        self._last_scores = scores
+        self._last_second_score = second_score
+        return self._build_result(best_concept, best_score, gap_to_second, scores)
+
+    def _build_result(self, best_concept: str, best_score: float,
+                      gap_to_second: float, scores: np.ndarray) -> RecognitionResult:
+        """Apply temporal filter + Tier 4 validation to the best match."""
         # PHASE 3: Apply temporal smoothing filter (hysteresis for stable recognition)
         confirmed_concept = self.temporal_filter.update(best_concept, best_score)
 
@@ -513,9 +852,8 @@ class RecognitionEngineUI:
         
         return frame
 
-    def _draw_dashboard(self, frame: np.ndarray, result: RecognitionResult) -> np.ndarray:
-        """Draw interactive dashboard on frame."""
-        h, w, _ = frame.shape
+    def _draw_confidence_bars(self, frame: np.ndarray, result: RecognitionResult) -> int:
+        """Draw per-concept confidence bars. Returns the panel's bottom y."""
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 0.6
         thickness = 1
@@ -527,51 +865,35 @@ class RecognitionEngineUI:
         bar_width = 200
         bar_x_left = 20
 
-        # Title
-        cv2.putText(
-            frame,
-            "CONFIDENCE SCORES",
-            (bar_x_left, bar_y_start - 10),
-            font,
-            0.7,
-            COLOR_TEXT,
-            2,
-        )
+        # Title (pre-rendered sprite)
+        self._blit_sprite(frame, self._title_sprite, bar_x_left, bar_y_start - 10)
+
+        # PHASE 3: Enhanced color coding (vectorized: bin all scores, index the LUT)
+        scores = result.all_scores
+        bar_colors = COLOR_LUT[np.digitize(scores, CONFIDENCE_BINS)].tolist()
+        fill_widths = (bar_width * scores).astype(np.int32).tolist()
+        confirmed_concept = result.concept if result.verification_status == "verified" else None
 
         # Draw bars for each concept
-        for idx, concept in enumerate(self.concept_names):
-            score = result.all_scores.get(concept, 0.0)
+        for idx, (concept, score) in enumerate(zip(self.concept_names, scores.tolist())):
             y_pos = bar_y_start + idx * (bar_height + bar_spacing)
+            confirmed = concept == confirmed_concept
 
             # Bar background (dark)
-            cv2.rectangle(frame, (bar_x_left, y_pos), (bar_x_left + bar_width, y_pos + bar_height), (30, 30, 30), -1)
+            self._fill_rect(frame, bar_x_left, y_pos, bar_x_left + bar_width, y_pos + bar_height, (30, 30, 30))
 
-            # Bar fill (colored based on score)
-            fill_width = int(bar_width * score)
-            
-            # PHASE 3: Enhanced color coding
-            # Confirmed concept gets bright green
-            if concept == result.concept and result.verification_status == "verified":
-                bar_color = (0, 255, 0)  # Bright GREEN for confirmed
-            elif score >= 0.90:
-                bar_color = COLOR_BAR_HIGH  # Green for high score
-            elif score >= 0.80:
-                bar_color = (0, 200, 100)  # Dark green for medium-high
-            elif score >= 0.50:
-                bar_color = COLOR_BAR_MED  # Orange for medium
-            elif score >= 0.20:
-                bar_color = (0, 100, 200)  # Light orange for low
-            else:
-                bar_color = COLOR_BAR_LOW  # Red for very low
+            # Bar fill (confirmed concept gets bright green)
+            fill_width = fill_widths[idx]
+            bar_color = (0, 255, 0) if confirmed else tuple(bar_colors[idx])
 
-            cv2.rectangle(frame, (bar_x_left, y_pos), (bar_x_left + fill_width, y_pos + bar_height), bar_color, -1)
+            self._fill_rect(frame, bar_x_left, y_pos, bar_x_left + fill_width, y_pos + bar_height, bar_color)
 
             # Threshold line (0.80) - shows confirmation threshold
             threshold_x = bar_x_left + int(bar_width * COSINE_SIM_THRESHOLD)
-            cv2.line(frame, (threshold_x, y_pos), (threshold_x, y_pos + bar_height), (255, 255, 255), 1)
+            self._fill_rect(frame, threshold_x, y_pos, threshold_x, y_pos + bar_height, (255, 255, 255))
 
             # Border (brighter for confirmed)
-            if concept == result.concept and result.verification_status == "verified":
+            if confirmed:
                 border_color = (0, 255, 0)  # GREEN border for confirmed
                 border_thickness = 2
             else:
@@ -581,18 +903,61 @@ class RecognitionEngineUI:
                          border_color, border_thickness)
 
             # Label + score (brighter for confirmed)
-            label_text = f"{concept[:8]:8s} {score:.2f}"
-            if concept == result.concept and result.verification_status == "verified":
+            # Concept label is a cached sprite; only the score is rasterized per frame
+            normal_sprite, confirmed_sprite = self._label_sprites[concept]
+            if confirmed:
+                label_sprite = confirmed_sprite
                 label_color = (0, 255, 0)  # GREEN text for confirmed
                 label_thickness = 2
             else:
+                label_sprite = normal_sprite
                 label_color = COLOR_TEXT
                 label_thickness = thickness
-            cv2.putText(frame, label_text, (bar_x_left + bar_width + 10, y_pos + 15), 
+            label_x = bar_x_left + bar_width + 10
+            advance = self._blit_sprite(frame, label_sprite, label_x, y_pos + 15)
+            cv2.putText(frame, f"{score:.2f}", (label_x + advance, y_pos + 15),
                        font, font_scale, label_color, label_thickness)
 
+        return min(frame.shape[0], bar_y_start + len(self.concept_names) * (bar_height + bar_spacing))
+
+    def _render_confidence_panel(self, result: RecognitionResult, h: int, w: int) -> Tuple:
+        """
+        Render the confidence bars into a sprite (same layout as _blit_sprite).
+
+        The panel is drawn over black and over white; the difference gives
+        the per-pixel coverage, so the cached layers hold only panel content.
+        """
+        panel_w = min(w, DASHBOARD_PANEL_WIDTH)
+        over_black = np.zeros((h, panel_w, 3), dtype=np.uint8)
+        over_white = np.full_like(over_black, 255)
+        panel_h = self._draw_confidence_bars(over_black, result)
+        self._draw_confidence_bars(over_white, result)
+
+        premult = over_black[:panel_h].astype(np.float32)
+        inv_alpha = (over_white[:panel_h].astype(np.float32) - premult) / 255.0
+        return inv_alpha, premult, 0, 0, panel_w
+
+    def _draw_dashboard(self, frame: np.ndarray, result: RecognitionResult) -> np.ndarray:
+        """Draw interactive dashboard on frame."""
+        h, w, _ = frame.shape
+        font = cv2.FONT_HERSHEY_SIMPLEX
+
+        # Confidence bars: re-rendered every DASHBOARD_EVERY frames (or when the
+        # verified state changes), then composited over the live frame
+        self._frame_no += 1
+        verified = result.verification_status == "verified"
+        overlay_key = (result.verification_status, result.concept if verified else None, h, w)
+        if (
+            self._last_overlay is None
+            or self._frame_no % DASHBOARD_EVERY == 0
+            or overlay_key != self._last_overlay_key
+        ):
+            self._last_overlay = self._render_confidence_panel(result, h, w)
+            self._last_overlay_key = overlay_key
+        self._blit_sprite(frame, self._last_overlay, 0, 0)
+
         # Window progress indicator
-        window_pct = len(self.landmark_window) / WINDOW_SIZE * 100
+        window_pct = len(self.landmark_window) / self.window_size * 100
         cv2.putText(
             frame,
             f"Window: {window_pct:.0f}%",
@@ -605,10 +970,10 @@ class RecognitionEngineUI:
 
         # Cooldown timer
         if result.frame_window_complete:
-            now_ms = time.time() * 1000
-            cooldown_remaining_ms = max(0, self.cooldown_ms - (now_ms - self.last_match_time))
-            if result.verification_status == "verified" and cooldown_remaining_ms > 0:
-                timer_text = f"Cooldown: {cooldown_remaining_ms / 1000:.1f}s"
+            now_ns = time.monotonic_ns()
+            cooldown_remaining_ns = max(0, self._cooldown_ns - (now_ns - self.last_match_time))
+            if result.verification_status == "verified" and cooldown_remaining_ns > 0:
+                timer_text = f"Cooldown: {cooldown_remaining_ns / 1e9:.1f}s"
                 cv2.putText(
                     frame,
                     timer_text,
@@ -646,97 +1011,176 @@ class RecognitionEngineUI:
         if not self.debug or not result.concept:
             return frame
 
-        golden_pose = self.golden_signatures.get(result.concept)
-        if not golden_pose:
+        golden_xy = self.golden_signatures.get(result.concept)
+        if golden_xy is None:
             return frame
 
         h, w, _ = frame.shape
 
-        try:
-            # Extract landmarks from golden pose
-            pose_landmarks = golden_pose.get("pose_landmarks", [])
-            if not pose_landmarks:
-                return frame
-
-            # Convert from normalized to pixel coordinates
-            pose_pixels = []
-            for lm in pose_landmarks[:6]:  # Only pose
-                x_pixel = int(lm["x"] * w)
-                y_pixel = int(lm["y"] * h)
-                pose_pixels.append((x_pixel, y_pixel))
-
-            # Draw ghost skeleton (faint grey)
-            # Connect shoulders -> hips
-            if len(pose_pixels) >= 4:
-                connections = [(0, 1), (0, 2), (1, 3), (2, 4)]  # Simplified pose connections
-                for start_idx, end_idx in connections:
-                    if start_idx < len(pose_pixels) and end_idx < len(pose_pixels):
-                        start = pose_pixels[start_idx]
-                        end = pose_pixels[end_idx]
-                        cv2.line(frame, start, end, COLOR_GHOST, 2)
-
-            # Draw joints as small circles
-            for pixel in pose_pixels:
-                cv2.circle(frame, pixel, 3, COLOR_GHOST, -1)
+        # Convert from normalized to pixel coordinates (single vectorized op)
+        pose_pixels = (golden_xy * np.array([w, h], dtype=np.float32)).astype(np.int32)
+        num_points = len(pose_pixels)
 
-        except Exception:
-            pass  # Silent fail if ghost skeleton data malformed
+        # Draw ghost skeleton (faint grey)
+        # Connect shoulders -> hips (all segments in one polylines call)
+        if num_points >= 4:
+            connections = GHOST_CONNECTIONS[(GHOST_CONNECTIONS < num_points).all(axis=1)]
+            cv2.polylines(frame, list(pose_pixels[connections]), False, COLOR_GHOST, 2)
+
+        # Draw joints as small circles
+        for pixel in pose_pixels.tolist():
+            cv2.circle(frame, tuple(pixel), 3, COLOR_GHOST, -1)
 
         return frame
 
     def _emit_socket(self, concept_id: str, score: float):
-        """Emit recognition result via Socket.io.
+        """Queue recognition result for Socket.io emission.
         
         PHASE 3: Enhanced emission with translation_event structure
         
         Emits two complementary events:
         1. 'sign_recognized' - Legacy (backward compatible)
         2. 'translation_event' - New (Phase 3, with full metadata)
+
+        Payloads are built here and sent on the asyncio loop thread;
+        events are dropped if EMIT_QUEUE_SIZE emits are already pending.
         """
         if not self.socket_url or not self.sio or not self.socket_connected:
             return
 
-        try:
-            # Get concept metadata
-            concept_data = self.concept_registry.get(concept_id, {})
-            concept_name = concept_data.get("concept_name", concept_id)
-            bsl_target_path = concept_data.get("bsl_target_file", "")
-            
-            # Legacy event (backward compatible)
-            legacy_payload = {
-                "concept": concept_id,
-                "score": float(score),
-                "timestamp": time.time(),
-            }
-            self.sio.emit("sign_recognized", legacy_payload)
-            
-            # Phase 3: translation_event (full metadata)
-            translation_payload = {
-                "concept_id": concept_id,
-                "concept_name": concept_name,
-                "bsl_target_path": str(bsl_target_path) if bsl_target_path else None,
-                "similarity_score": float(score),
-                "timestamp": time.time(),
-                "source": "recognition_engine_ui",
-                "verification_status": "verified"
-            }
-            self.sio.emit("translation_event", translation_payload)
-            
-            if self.debug:
-                print(f"📡 Emitted translation_event: {concept_name} → {Path(bsl_target_path).name if bsl_target_path else 'N/A'}")
-        except Exception as e:
-            print(f"⚠️  Socket.io emit failed: {e}")
+        # Get concept metadata (precomputed at init)
+        concept_name, bsl_target_path = self._emit_meta.get(concept_id, (concept_id, ""))
+        timestamp = time.time()
+
+        # Legacy event (backward compatible)
+        legacy_payload = {
+            "concept": concept_id,
+            "score": float(score),
+            "timestamp": timestamp,
+        }
+
+        # Phase 3: translation_event (full metadata)
+        translation_payload = {
+            "concept_id": concept_id,
+            "concept_name": concept_name,
+            "bsl_target_path": bsl_target_path or None,
+            "similarity_score": float(score),
+            "timestamp": timestamp,
+            "source": "recognition_engine_ui",
+            "verification_status": "verified"
+        }
+
+        if not self._emit_slots.acquire(blocking=False):
+            print(f"⚠️  Socket.io backlog full, dropped event for {concept_name}")
+            return
+        asyncio.run_coroutine_threadsafe(
+            self._emit_events([
+                ("sign_recognized", legacy_payload),
+                ("translation_event", translation_payload),
+            ]),
+            self._loop,
+        )
+
+        if self.debug:
+            print(f"📡 Queued translation_event: {concept_name} → {Path(bsl_target_path).name if bsl_target_path else 'N/A'}")
+
+    def _set_stride(self, recognize_every: int):
+        """
+        Scale the window and confirmation length to one detection per
+        `recognize_every` camera frames.
+
+        Only real MediaPipe detections enter the window and temporal filter,
+        so both are shortened by the stride to keep their camera-frame span
+        (e.g. stride 2: 15-detection window, 3 detections to confirm).
+        """
+        self.window_size = -(-WINDOW_SIZE // recognize_every)
+        self.temporal_filter.min_frames = -(-TEMPORAL_MIN_FRAMES // recognize_every)
+        self._window_buf = np.empty((self.window_size, NUM_FRAME_LANDMARKS, 3), dtype=np.float32)
+        self.landmark_window = self.landmark_window[-self.window_size:]
+
+    def _recognition_worker(self, frame_q: queue.Queue, result_q: queue.Queue,
+                            stop: threading.Event, recognize_every: int = DEFAULT_RECOGNIZE_EVERY):
+        """Consume camera frames and publish recognition results (background thread)."""
+        prev_gray = None  # Thumbnail of the last frame that was recognized
+        redundant_skips = 0
+        tick = 0
+
+        while not stop.is_set():
+            try:
+                frame = frame_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            tick += 1
+
+            with self._state_lock:
+                if tick % recognize_every != 0 and self._last_result is not None:
+                    # Fixed stride: in-between frames reuse the last result (the
+                    # window + filter only advance on real detections; see _set_stride)
+                    result = self._last_result
+                else:
+                    # Skip MediaPipe + scoring when the frame barely changed
+                    cur_gray = cv2.resize(
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+                        REDUNDANCY_THUMB_SIZE,
+                        interpolation=cv2.INTER_AREA,
+                    )
+                    redundant = (
+                        prev_gray is not None
+                        and self._last_result is not None
+                        and redundant_skips < MAX_REDUNDANT_SKIPS
+                        and (cv2.absdiff(cur_gray, prev_gray) < REDUNDANCY_PIXEL_TAU).mean()
+                        > REDUNDANCY_RATIO
+                    )
+
+                    # Recognize (a redundant frame reuses the last result: repeated
+                    # landmarks must not count as fresh confirmations)
+                    if redundant:
+                        result = self._last_result
+                        redundant_skips += 1
+                    else:
+                        result = self.recognize(frame)
+                        prev_gray = cur_gray
+                        redundant_skips = 0
+
+            # Keep only the newest result for the render loop
+            try:
+                result_q.get_nowait()
+            except queue.Empty:
+                pass
+            result_q.put(result)
+
+    def run(self, camera_id: int = 0, delay_ms: int = 1,
+            recognize_every: int = DEFAULT_RECOGNIZE_EVERY):
+        """
+        Main recognition loop.
 
-    def run(self, camera_id: int = 0, delay_ms: int = 1):
-        """Main recognition loop."""
+        The main thread captures and renders; MediaPipe + scoring run on a
+        worker thread, connected by single-slot queues (newest frame wins).
+        Every captured frame is displayed, with the newest worker result
+        drawn over it, so the UI runs at camera rate, not recognition rate.
+        """
         cap = cv2.VideoCapture(camera_id)
         if not cap.isOpened():
             print(f"❌ Failed to open camera {camera_id}")
             return
 
         print(f"🎥 Camera opened. Press ESC or 'q' to quit, 'r' to reset window")
+        recognize_every = max(1, recognize_every)
+        self._set_stride(recognize_every)
         print(f"🔄 Temporal smoothing: {self.temporal_filter.min_frames} frames @ {self.temporal_filter.threshold:.2f}+ threshold")
 
+        frame_q = queue.Queue(maxsize=1)
+        result_q = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        worker = threading.Thread(
+            target=self._recognition_worker,
+            args=(frame_q, result_q, stop, recognize_every),
+            daemon=True,
+        )
+        worker.start()
+
+        latest = None  # Newest worker result, drawn over every captured frame
         try:
             while True:
                 ret, frame = cap.read()
@@ -745,30 +1189,48 @@ class RecognitionEngineUI:
 
                 frame = cv2.flip(frame, 1)  # Selfie view
 
-                # Recognize
-                result = self.recognize(frame)
-
-                # Draw dashboard
-                frame = self._draw_dashboard(frame, result)
-
-                # PHASE 3: Draw winner display if verified
-                if result.verification_status == "verified":
-                    frame = self._draw_winner_display(frame, result.concept, result.bsl_target_file)
-
-                # Draw ghost skeleton (if debug + verified)
-                if self.debug:
-                    frame = self._draw_ghost_skeleton(frame, result)
-
-                # Handle verification + cooldown + Socket.io
-                if result.frame_window_complete and result.verification_status == "verified":
-                    now_ms = time.time() * 1000
-                    if now_ms - self.last_match_time > self.cooldown_ms:
-                        # Emit and reset cooldown
-                        self._emit_socket(result.concept, result.similarity_score)
-                        self.last_match_time = now_ms
-                        self.last_matched_concept = result.concept
+                # Hand the newest frame to the worker (drop a stale one); it gets
+                # its own copy since the dashboard is drawn onto `frame` below
+                try:
+                    frame_q.get_nowait()
+                except queue.Empty:
+                    pass
+                frame_q.put_nowait(frame.copy())
 
-                # Display
+                # Pick up a newer recognition result, if the worker finished one
+                try:
+                    latest = result_q.get_nowait()
+                    new_result = True
+                except queue.Empty:
+                    new_result = False
+
+                result = latest
+                if result is not None:
+                    # Draw dashboard
+                    frame = self._draw_dashboard(frame, result)
+
+                    # PHASE 3: Draw winner display if verified
+                    if result.verification_status == "verified":
+                        frame = self._draw_winner_display(frame, result.concept, result.bsl_target_file)
+
+                    # Draw ghost skeleton (if debug + verified)
+                    if self.debug:
+                        frame = self._draw_ghost_skeleton(frame, result)
+
+                    # Handle verification + cooldown + Socket.io (once per worker result)
+                    if (
+                        new_result
+                        and result.frame_window_complete
+                        and result.verification_status == "verified"
+                    ):
+                        now_ns = time.monotonic_ns()
+                        if now_ns - self.last_match_time > self._cooldown_ns:
+                            # Emit and reset cooldown
+                            self._emit_socket(result.concept, result.similarity_score)
+                            self.last_match_time = now_ns
+                            self.last_matched_concept = result.concept
+
+                # Display (every captured frame, at camera rate)
                 cv2.imshow("Sign Language Recognition - MVP Dashboard", frame)
 
                 # Keyboard input
@@ -777,20 +1239,27 @@ class RecognitionEngineUI:
                     print("\n👋 Exiting...")
                     break
                 elif key == ord("r"):  # r
-                    self.landmark_window = []
-                    self.temporal_filter.reset()
+                    with self._state_lock:
+                        self.landmark_window = []
+                        self.temporal_filter.reset()
+                        self._last_result = None
+                    latest = None
                     print("🔄 Window and temporal filter reset")
 
         finally:
+            stop.set()
+            worker.join(timeout=1.0)
             cap.release()
             cv2.destroyAllWindows()
             self.holistic.close()
-            if self.sio:
+            if self.sio and self._loop:
                 try:
-                    self.sio.disconnect()
+                    asyncio.run_coroutine_threadsafe(
+                        self.sio.disconnect(), self._loop
+                    ).result(timeout=2.0)
                 except Exception:
                     pass
-
+                self._loop.call_soon_threadsafe(self._loop.stop)
 
 # ============================================================================
 # MAIN
@@ -809,6 +1278,12 @@ def main():
     parser.add_argument("--delay", type=int, default=1, help="Frame delay in ms")
     parser.add_argument("--socket-url", type=str, help="Socket.io server URL (e.g., http://localhost:5000)")
     parser.add_argument("--cooldown", type=int, default=DEFAULT_COOLDOWN_MS, help="Cooldown after match (ms)")
+    parser.add_argument("--recognize-every", type=int, default=DEFAULT_RECOGNIZE_EVERY,
+                        help="Run recognition on every Nth frame; window and confirmation "
+                             "lengths are divided by N (1 = every frame)")
+    parser.add_argument("--int8", action="store_true", help="Score with int8-quantized embeddings")
+    parser.add_argument("--fast-track", action="store_true",
+                        help="While confirming, re-score only that concept between full scans")
 
     args = parser.parse_args()
 
@@ -817,8 +1292,10 @@ def main():
             debug=args.debug,
             socket_url=args.socket_url,
             cooldown_ms=args.cooldown,
+            quantized=args.int8,
+            fast_track=args.fast_track,
         )
-        engine.run(camera_id=args.camera, delay_ms=args.delay)
+        engine.run(camera_id=args.camera, delay_ms=args.delay, recognize_every=args.recognize_every)
         return 0
     except Exception as e:
         print(f"❌ Error: {e}")
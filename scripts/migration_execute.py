@@ -9,157 +9,414 @@ This script:
 3. Refactors translation_map.json to concept-centric schema
 4. Backs up original translation_map.json
 5. Tests all registries load correctly
+
+With --ndjson, the registries and concept map are instead streamed to
+line-delimited JSON files (one concept per line, _metadata line first) and
+the original translation_map.json is left untouched.
 """
 
+import argparse
 import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Any, List, Optional
+
+# Paths (relative to the repo root, where the migration is run)
+TMAP_PATH = Path('translation_map.json')
+REG_DIR = Path('assets/registries')
+ASL_PATH = REG_DIR / 'asl_registry.json'
+BSL_PATH = REG_DIR / 'bsl_registry.json'
+
+# NDJSON outputs (--ndjson mode; written alongside, never over, the JSON files)
+TMAP_NDJSON_PATH = Path('translation_map.ndjson')
+ASL_NDJSON_PATH = REG_DIR / 'asl_registry.ndjson'
+BSL_NDJSON_PATH = REG_DIR / 'bsl_registry.ndjson'
+
+# ijson optional import (streaming parse; falls back to json.load)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# orjson optional import (fast encoder; falls back to json.dump)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# msgspec optional import (typed registry entries + fast encoder; falls back to dicts)
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+if HAS_MSGSPEC:
+    class ASLEntry(msgspec.Struct):
+        """ASL registry entry (field order = JSON key order)"""
+        concept_name: Optional[str]
+        concept_description: Optional[str]
+        signatures: List[Any]
+        embedding_mean_file: Optional[str]
+        metadata: dict
+
+    class BSLEntry(msgspec.Struct):
+        """BSL registry entry"""
+        concept_name: Optional[str]
+        concept_description: Optional[str]
+        target: Any
+        embedding_mean_file: Optional[str]
+        metadata: dict
+
+    class TmapEntry(msgspec.Struct):
+        """Concept-centric translation_map entry"""
+        concept_id: Optional[str]
+        concept_name: Optional[str]
+        concept_description: Optional[str]
+        semantic_concept_vector: Any
+        languages: List[str]
+        difficulty: Any
+        hands_involved: Any
+        pose_involvement: Any
+        face_involvement: Any
+        status: Any
+        notes: Any
+else:
+    # Keyword construction works the same on plain dicts
+    ASLEntry = BSLEntry = TmapEntry = dict
+
+def write_json(path, obj):
+    """
+    Write obj as indented JSON (orjson bytes in one write when available).
+    
+    Writes to a temp file and renames it over path, so readers never see
+    a partially written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if HAS_MSGSPEC:
+        tmp_path.write_bytes(msgspec.json.format(msgspec.json.encode(obj), indent=2))
+    elif HAS_ORJSON:
+        tmp_path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(obj, f, indent=2)
+    os.replace(tmp_path, path)
+
+def encode_line(obj):
+    """Encode obj as one compact NDJSON line (bytes, trailing newline)"""
+    if HAS_MSGSPEC:
+        return msgspec.json.encode(obj) + b"\n"
+    if HAS_ORJSON:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj) + "\n").encode()
+
+def _concept_ids(d):
+    """Concept IDs of a registry dict (keys not starting with '_')"""
+    return frozenset(k for k in d if k[:1] != '_')
+
+def fsync_dir(path):
+    """fsync a directory so newly created entries are durable (no-op where unsupported)"""
+    try:
+        dir_fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass  # e.g. Windows cannot fsync directories
+    finally:
+        os.close(dir_fd)
+
+def iter_tmap_items(path=TMAP_PATH):
+    """Yield top-level (key, value) pairs of translation_map.json, one concept at a time"""
+    if HAS_IJSON:
+        with open(path, 'rb') as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    else:
+        with open(path) as f:
+            yield from json.load(f).items()
+
+def _ndjson_concept_ids(path):
+    """Concept IDs of an NDJSON registry, read one line at a time"""
+    ids = set()
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                ids.update(k for k in json.loads(line) if k[:1] != '_')
+    return frozenset(ids)
 
-def backup_original():
+def copy_atomic(src, dst):
+    """
+    Copy src to dst so that dst never appears partially written.
+    
+    On Linux the bytes go to an anonymous O_TMPFILE inode that is linked
+    into place only once complete; elsewhere a temp file is renamed over dst.
+    """
+    dst = Path(dst)
+    if hasattr(os, 'O_TMPFILE'):
+        try:
+            fd = os.open(dst.parent, os.O_TMPFILE | os.O_WRONLY, 0o644)
+            with os.fdopen(fd, 'wb') as out, open(src, 'rb') as f:
+                shutil.copyfileobj(f, out, 1 << 20)
+                out.flush()
+                os.link(f"/proc/self/fd/{out.fileno()}", dst)
+            return
+        except OSError:
+            pass  # FS without O_TMPFILE, or no /proc: use the rename below
+    tmp_path = dst.with_name(f"{dst.name}.tmp")
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+def backup_original(run_ts=None):
     """Create backup of original translation_map.json"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"translation_map.json.backup_{timestamp}"
+    timestamp = (run_ts or datetime.now()).strftime("%Y%m%d_%H%M%S")
+    backup_path = TMAP_PATH.with_name(f"{TMAP_PATH.name}.backup_{timestamp}")
     
-    if os.path.exists('translation_map.json'):
-        shutil.copy('translation_map.json', backup_path)
+    if TMAP_PATH.exists():
+        # Independent copy: other tools rewrite translation_map.json in
+        # place, which would clobber a hardlinked backup
+        copy_atomic(TMAP_PATH, backup_path)
         print(f"✓ Backup created: {backup_path}")
         return backup_path
     return None
 
-def extract_and_write():
-    """Extract registries and write all files"""
-    
-    # Load original
-    with open('translation_map.json') as f:
-        original_tmap = json.load(f)
-    
-    # Create registries
-    asl_registry = {
-        "_metadata": {
+def registry_metadata(language, now_iso):
+    """_metadata block for a language registry"""
+    if language == 'asl':
+        return {
             "language": "asl",
             "purpose": "ASL signatures and embeddings for recognition",
             "version": "1.0",
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now_iso,
             "description": "American Sign Language reference dataset - extracted from translation_map.json"
         }
+    return {
+        "language": "bsl",
+        "purpose": "BSL target signatures and embeddings for output",
+        "version": "1.0",
+        "last_updated": now_iso,
+        "description": "British Sign Language reference dataset - extracted from translation_map.json"
+    }
+
+def tmap_metadata(original_metadata, now_iso):
+    """_metadata block for the refactored translation_map"""
+    return {
+        **original_metadata,
+        "description": "Translation Registry: Concept Metadata (Language data in assets/registries/)",
+        "version": "2.1-refactored",
+        "last_updated": now_iso,
+        "notes": "Language-specific data moved to assets/registries/{asl,bsl}_registry.json for scalability"
     }
+
+def build_entries(c, concept_id):
+    """Build the (asl_entry, bsl_entry, tmap_entry) triple for one original concept"""
     
-    bsl_registry = {
-        "_metadata": {
-            "language": "bsl",
-            "purpose": "BSL target signatures and embeddings for output",
-            "version": "1.0",
-            "last_updated": datetime.now().isoformat(),
-            "description": "British Sign Language reference dataset - extracted from translation_map.json"
-        }
+    # Shared fields (read once, used by all three entries)
+    concept_name = c.get('concept_name')
+    concept_description = c.get('concept_description')
+    asl_signatures = c.get('asl_signatures')
+    bsl_target = c.get('bsl_target')
+    hands_involved = c.get('hands_involved')
+    pose_involvement = c.get('pose_involvement')
+    face_involvement = c.get('face_involvement')
+    
+    # Shared (read-only) metadata for both language entries
+    metadata = {
+        "hands_involved": hands_involved,
+        "pose_involvement": pose_involvement,
+        "face_involvement": face_involvement
     }
     
-    # Process concepts
-    concepts = [k for k in original_tmap.keys() if not k.startswith('_')]
-    print(f"\nExtracting {len(concepts)} concepts...")
+    # ASL registry entry
+    asl_entry = ASLEntry(
+        concept_name=concept_name,
+        concept_description=concept_description,
+        signatures=c.get('asl_signatures', []),
+        embedding_mean_file=c.get('asl_embedding_mean_file'),
+        metadata=metadata
+    )
+    
+    # BSL registry entry
+    bsl_entry = BSLEntry(
+        concept_name=concept_name,
+        concept_description=concept_description,
+        target=bsl_target,
+        embedding_mean_file=c.get('bsl_embedding_mean_file'),
+        metadata=metadata
+    )
+    
+    # Determine available languages
+    languages = []
+    if asl_signatures:
+        languages.append('asl')
+    if bsl_target:
+        languages.append('bsl')
+    
+    # Concept metadata for the new translation_map
+    tmap_entry = TmapEntry(
+        concept_id=concept_id,
+        concept_name=concept_name,
+        concept_description=concept_description,
+        semantic_concept_vector=c.get('semantic_concept_vector'),
+        languages=languages,
+        difficulty=c.get('difficulty'),
+        hands_involved=hands_involved,
+        pose_involvement=pose_involvement,
+        face_involvement=face_involvement,
+        status=c.get('status'),
+        notes=c.get('notes')
+    )
+    
+    return asl_entry, bsl_entry, tmap_entry
+
+def iter_concept_entries(original_metadata):
+    """
+    Stream concepts from the original map, yielding
+    (concept_id, asl_entry, bsl_entry, tmap_entry) as each one is parsed.
     
-    for concept in concepts:
-        c = original_tmap[concept]
+    The original _metadata block is copied into original_metadata when seen.
+    """
+    for key, c in iter_tmap_items():
+        if key == '_metadata':
+            original_metadata.update(c)
+            continue
+        if key.startswith('_'):
+            continue
         concept_id = c.get('concept_id')
         
-        # ASL registry entry
-        asl_registry[concept_id] = {
-            "concept_name": c.get('concept_name'),
-            "concept_description": c.get('concept_description'),
-            "signatures": c.get('asl_signatures', []),
-            "embedding_mean_file": c.get('asl_embedding_mean_file'),
-            "metadata": {
-                "hands_involved": c.get('hands_involved'),
-                "pose_involvement": c.get('pose_involvement'),
-                "face_involvement": c.get('face_involvement')
-            }
-        }
-        
-        # BSL registry entry
-        bsl_registry[concept_id] = {
-            "concept_name": c.get('concept_name'),
-            "concept_description": c.get('concept_description'),
-            "target": c.get('bsl_target'),
-            "embedding_mean_file": c.get('bsl_embedding_mean_file'),
-            "metadata": {
-                "hands_involved": c.get('hands_involved'),
-                "pose_involvement": c.get('pose_involvement'),
-                "face_involvement": c.get('face_involvement')
-            }
-        }
-        
-        print(f"  ✓ {concept_id}")
+        asl_entry, bsl_entry, tmap_entry = build_entries(c, concept_id)
+        yield concept_id, asl_entry, bsl_entry, tmap_entry
+
+def print_extracted(concept_ids):
+    """One buffered write for the per-concept progress lines"""
+    if concept_ids:
+        print("\n".join(f"  ✓ {cid}" for cid in concept_ids))
+    print(f"Extracted {len(concept_ids)} concepts")
+
+def extract_and_write(now_iso=None):
+    """Extract registries and write all files"""
+    
+    # One timestamp for all three metadata blocks
+    now_iso = now_iso or datetime.now().isoformat()
+    
+    # Create registries
+    asl_registry = {"_metadata": registry_metadata('asl', now_iso)}
+    bsl_registry = {"_metadata": registry_metadata('bsl', now_iso)}
+    
+    # All three entries are built as each concept is parsed, so the full
+    # original document is never held in memory
+    original_metadata = {}
+    concept_entries = {}
+    print(f"\nExtracting concepts...")
+    
+    for concept_id, asl_entry, bsl_entry, tmap_entry in iter_concept_entries(original_metadata):
+        asl_registry[concept_id] = asl_entry
+        bsl_registry[concept_id] = bsl_entry
+        concept_entries[concept_id] = tmap_entry
+    
+    print_extracted(list(concept_entries))
     
     # Create new translation_map with concept metadata only
     new_tmap = {
-        "_metadata": {
-            **original_tmap.get('_metadata', {}),
-            "description": "Translation Registry: Concept Metadata (Language data in assets/registries/)",
-            "version": "2.1-refactored",
-            "last_updated": datetime.now().isoformat(),
-            "notes": "Language-specific data moved to assets/registries/{asl,bsl}_registry.json for scalability"
-        }
+        "_metadata": tmap_metadata(original_metadata, now_iso),
+        **concept_entries
     }
     
-    for concept in concepts:
-        c = original_tmap[concept]
-        concept_id = c.get('concept_id')
-        
-        # Determine available languages
-        languages = []
-        if c.get('asl_signatures'):
-            languages.append('asl')
-        if c.get('bsl_target'):
-            languages.append('bsl')
+    return new_tmap, asl_registry, bsl_registry
+
+def write_ndjson_registries(now_iso=None):
+    """
+    Stream registries to NDJSON: each concept is written as soon as it is
+    parsed, so memory stays O(1) per concept instead of holding all outputs.
+    """
+    now_iso = now_iso or datetime.now().isoformat()
+    REG_DIR.mkdir(parents=True, exist_ok=True)
+    
+    paths = (ASL_NDJSON_PATH, BSL_NDJSON_PATH, TMAP_NDJSON_PATH)
+    tmp_paths = [p.with_name(f"{p.name}.tmp") for p in paths]
+    # tmap concept lines are buffered in a body file: its _metadata line
+    # (from the original's _metadata, wherever it appears) is written first
+    tmap_body_path = TMAP_NDJSON_PATH.with_name(f"{TMAP_NDJSON_PATH.name}.body.tmp")
+    original_metadata = {}
+    concept_ids = []
+    print(f"\nExtracting concepts...")
+    
+    with open(tmp_paths[0], 'wb') as asl_out, \
+         open(tmp_paths[1], 'wb') as bsl_out, \
+         open(tmap_body_path, 'wb') as tmap_out:
+        asl_out.write(encode_line({"_metadata": registry_metadata('asl', now_iso)}))
+        bsl_out.write(encode_line({"_metadata": registry_metadata('bsl', now_iso)}))
         
-        new_tmap[concept_id] = {
-            "concept_id": concept_id,
-            "concept_name": c.get('concept_name'),
-            "concept_description": c.get('concept_description'),
-            "semantic_concept_vector": c.get('semantic_concept_vector'),
-            "languages": languages,
-            "difficulty": c.get('difficulty'),
-            "hands_involved": c.get('hands_involved'),
-            "pose_involvement": c.get('pose_involvement'),
-            "face_involvement": c.get('face_involvement'),
-            "status": c.get('status'),
-            "notes": c.get('notes')
-        }
+        for concept_id, asl_entry, bsl_entry, tmap_entry in iter_concept_entries(original_metadata):
+            asl_out.write(encode_line({concept_id: asl_entry}))
+            bsl_out.write(encode_line({concept_id: bsl_entry}))
+            tmap_out.write(encode_line({concept_id: tmap_entry}))
+            concept_ids.append(concept_id)
     
-    return new_tmap, asl_registry, bsl_registry
+    with open(tmp_paths[2], 'wb') as tmap_out, open(tmap_body_path, 'rb') as body:
+        tmap_out.write(encode_line({"_metadata": tmap_metadata(original_metadata, now_iso)}))
+        shutil.copyfileobj(body, tmap_out, 1 << 20)
+    os.remove(tmap_body_path)
+    
+    for tmp_path, path in zip(tmp_paths, paths):
+        os.replace(tmp_path, path)
+        print(f"✓ Wrote {path}")
+    fsync_dir(REG_DIR)
+    fsync_dir(TMAP_NDJSON_PATH.parent)
+    
+    print_extracted(concept_ids)
 
-def write_registries():
-    """Write all registry files"""
+def write_registries(now_iso=None):
+    """Write all registry files (returns the written dicts)"""
     
-    new_tmap, asl_registry, bsl_registry = extract_and_write()
+    new_tmap, asl_registry, bsl_registry = extract_and_write(now_iso)
     
     # Create registries directory
-    registries_dir = 'assets/registries'
-    os.makedirs(registries_dir, exist_ok=True)
+    REG_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Write ASL registry
-    asl_path = os.path.join(registries_dir, 'asl_registry.json')
-    with open(asl_path, 'w') as f:
-        json.dump(asl_registry, f, indent=2)
-    print(f"\n✓ Wrote ASL registry: {asl_path}")
+    # Write ASL, BSL and refactored translation_map.json concurrently: each
+    # write_json is independent and spends most of its time in I/O
+    writes = [
+        (ASL_PATH, asl_registry, f"\n✓ Wrote ASL registry: {ASL_PATH}"),
+        (BSL_PATH, bsl_registry, f"✓ Wrote BSL registry: {BSL_PATH}"),
+        (TMAP_PATH, new_tmap, "✓ Wrote refactored translation_map.json"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(writes)) as pool:
+        futures = [pool.submit(write_json, path, obj) for path, obj, _ in writes]
+        for future, (_, _, msg) in zip(futures, writes):
+            future.result()
+            print(msg)
     
-    # Write BSL registry
-    bsl_path = os.path.join(registries_dir, 'bsl_registry.json')
-    with open(bsl_path, 'w') as f:
-        json.dump(bsl_registry, f, indent=2)
-    print(f"✓ Wrote BSL registry: {bsl_path}")
+    # No per-file fsync: this is a one-shot migration of small files and the
+    # original is backed up, so fsyncing the directories that received new
+    # entries (registries dir + translation_map.json's dir) is enough
+    fsync_dir(REG_DIR)
+    fsync_dir(TMAP_PATH.parent)
     
-    # Write refactored translation_map.json
-    with open('translation_map.json', 'w') as f:
-        json.dump(new_tmap, f, indent=2)
-    print(f"✓ Wrote refactored translation_map.json")
-    
-    return asl_registry, bsl_registry
+    return new_tmap, asl_registry, bsl_registry
 
-def test_registries():
-    """Test that all registries load correctly"""
+def test_registries(tmap=None, asl_reg=None, bsl_reg=None, ndjson=False):
+    """
+    Test that all registries load correctly.
+    
+    Registry dicts already in memory (e.g. from write_registries) are
+    validated directly; any left as None are loaded from disk.
+    """
+    
+    if ndjson:
+        load_ids = _ndjson_concept_ids
+        tmap_path, asl_path, bsl_path = TMAP_NDJSON_PATH, ASL_NDJSON_PATH, BSL_NDJSON_PATH
+    else:
+        def load_ids(path):
+            with open(path) as f:
+                return _concept_ids(json.load(f))
+        tmap_path, asl_path, bsl_path = TMAP_PATH, ASL_PATH, BSL_PATH
     
     print("\n" + "=" * 60)
     print("TESTING REGISTRIES")
@@ -167,37 +424,27 @@ def test_registries():
     
     # Load and validate each registry
     try:
-        with open('translation_map.json') as f:
-            tmap = json.load(f)
-        concepts = len([k for k in tmap.keys() if not k.startswith('_')])
-        print(f"✓ translation_map.json loaded: {concepts} concepts")
+        tmap_ids = _concept_ids(tmap) if tmap is not None else load_ids(tmap_path)
+        print(f"✓ {tmap_path.name} loaded: {len(tmap_ids)} concepts")
     except Exception as e:
-        print(f"✗ Error loading translation_map.json: {e}")
+        print(f"✗ Error loading {tmap_path.name}: {e}")
         return False
     
     try:
-        with open('assets/registries/asl_registry.json') as f:
-            asl_reg = json.load(f)
-        asl_concepts = len([k for k in asl_reg.keys() if not k.startswith('_')])
-        print(f"✓ asl_registry.json loaded: {asl_concepts} concepts")
+        asl_ids = _concept_ids(asl_reg) if asl_reg is not None else load_ids(asl_path)
+        print(f"✓ {asl_path.name} loaded: {len(asl_ids)} concepts")
     except Exception as e:
-        print(f"✗ Error loading asl_registry.json: {e}")
+        print(f"✗ Error loading {asl_path.name}: {e}")
         return False
     
     try:
-        with open('assets/registries/bsl_registry.json') as f:
-            bsl_reg = json.load(f)
-        bsl_concepts = len([k for k in bsl_reg.keys() if not k.startswith('_')])
-        print(f"✓ bsl_registry.json loaded: {bsl_concepts} concepts")
+        bsl_ids = _concept_ids(bsl_reg) if bsl_reg is not None else load_ids(bsl_path)
+        print(f"✓ {bsl_path.name} loaded: {len(bsl_ids)} concepts")
     except Exception as e:
-        print(f"✗ Error loading bsl_registry.json: {e}")
+        print(f"✗ Error loading {bsl_path.name}: {e}")
         return False
     
     # Validate cross-references
-    tmap_ids = set(k for k in tmap.keys() if not k.startswith('_'))
-    asl_ids = set(k for k in asl_reg.keys() if not k.startswith('_'))
-    bsl_ids = set(k for k in bsl_reg.keys() if not k.startswith('_'))
-    
     missing_asl = tmap_ids - asl_ids
     missing_bsl = tmap_ids - bsl_ids
     
@@ -214,33 +461,58 @@ def test_registries():
     return True
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Extract ASL/BSL registries from translation_map.json")
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Stream line-delimited JSON outputs (*.ndjson) instead of rewriting the JSON files')
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("FULL MIGRATION: Extract & Refactor Registries")
     print("=" * 60)
     
-    # Step 1: Backup
-    print("\n[STEP 1] Backing up original...")
-    backup = backup_original()
-    
-    # Step 2: Extract and write
-    print("\n[STEP 2] Extracting and writing registries...")
-    asl_reg, bsl_reg = write_registries()
-    
-    # Step 3: Test
-    print("\n[STEP 3] Testing registries...")
-    if test_registries():
-        print("\n" + "=" * 60)
-        print("✅ MIGRATION COMPLETE - All registries created and validated!")
-        print("=" * 60)
-        print(f"\nNew files created:")
-        print(f"  • assets/registries/asl_registry.json")
-        print(f"  • assets/registries/bsl_registry.json")
-        print(f"  • translation_map.json (refactored)")
-        print(f"\nBackup:")
-        print(f"  • {backup}")
-        print(f"\nNext steps:")
-        print(f"  1. Test recognition_engine.py")
-        print(f"  2. Update recognition_engine_ui.py")
-        print(f"  3. Update wlasl_pipeline.py")
+    # Single run timestamp shared by the backup name and registry metadata
+    run_ts = datetime.now()
+    
+    if args.ndjson:
+        # The original is only read, so no backup step
+        print("\n[STEP 1] Streaming NDJSON registries...")
+        write_ndjson_registries(run_ts.isoformat())
+        
+        print("\n[STEP 2] Testing registries...")
+        if test_registries(ndjson=True):
+            print("\n" + "=" * 60)
+            print("✅ MIGRATION COMPLETE - NDJSON registries created and validated!")
+            print("=" * 60)
+            print(f"\nNew files created:")
+            print(f"  • {ASL_NDJSON_PATH}")
+            print(f"  • {BSL_NDJSON_PATH}")
+            print(f"  • {TMAP_NDJSON_PATH}")
+        else:
+            print("\n✗ Migration failed - see errors above")
     else:
-        print("\n✗ Migration failed - see errors above")
+        # Step 1: Backup
+        print("\n[STEP 1] Backing up original...")
+        backup = backup_original(run_ts)
+        
+        # Step 2: Extract and write
+        print("\n[STEP 2] Extracting and writing registries...")
+        new_tmap, asl_reg, bsl_reg = write_registries(run_ts.isoformat())
+        
+        # Step 3: Test (on the dicts just written, no re-parse)
+        print("\n[STEP 3] Testing registries...")
+        if test_registries(new_tmap, asl_reg, bsl_reg):
+            print("\n" + "=" * 60)
+            print("✅ MIGRATION COMPLETE - All registries created and validated!")
+            print("=" * 60)
+            print(f"\nNew files created:")
+            print(f"  • {ASL_PATH}")
+            print(f"  • {BSL_PATH}")
+            print(f"  • translation_map.json (refactored)")
+            print(f"\nBackup:")
+            print(f"  • {backup}")
+            print(f"\nNext steps:")
+            print(f"  1. Test recognition_engine.py")
+            print(f"  2. Update recognition_engine_ui.py")
+            print(f"  3. Update wlasl_pipeline.py")
+        else:
+            print("\n✗ Migration failed - see errors above")
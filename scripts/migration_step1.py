@@ -7,12 +7,28 @@ Keeps translation_map.json intact during extraction phase.
 import json
 import os
 
-def extract_language_registries():
-    """Extract ASL and BSL registries from translation_map.json"""
-    
-    # Load current translation map
-    with open('translation_map.json') as f:
-        tmap = json.load(f)
+# ijson optional import (streaming parse; falls back to json.load)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+def concept_keys(d):
+    """Concept IDs of a registry dict in file order (keys not starting with '_')"""
+    return [k for k in d if k[:1] != '_']
+
+def iter_tmap_items(path='translation_map.json'):
+    """Yield top-level (key, value) pairs of translation_map.json, one concept at a time"""
+    if HAS_IJSON:
+        with open(path, 'rb') as f:
+            yield from ijson.kvitems(f, '', use_float=True)
+    else:
+        with open(path) as f:
+            yield from json.load(f).items()
+
+def extract_language_registries(tmap=None):
+    """Extract ASL and BSL registries from translation_map.json (or an already-parsed tmap)"""
     
     # Create registries
     asl_registry = {
@@ -35,25 +51,28 @@ def extract_language_registries():
         }
     }
     
-    # Process each concept
-    concepts = [k for k in tmap.keys() if not k.startswith('_')]
-    print(f"Processing {len(concepts)} concepts...\n")
-    
-    for concept in concepts:
-        c = tmap[concept]
+    # Process each concept as it is parsed from the current translation map
+    items = tmap.items() if tmap is not None else iter_tmap_items()
+    progress = []
+    for key, c in items:
+        if key.startswith('_'):
+            continue
         concept_id = c.get('concept_id')
         
+        # Shared (read-only) metadata for both language entries
+        metadata = {
+            "hands_involved": c.get('hands_involved'),
+            "pose_involvement": c.get('pose_involvement'),
+            "face_involvement": c.get('face_involvement')
+        }
+        
         # Extract ASL data
         asl_registry[concept_id] = {
             "concept_name": c.get('concept_name'),
             "concept_description": c.get('concept_description'),
             "signatures": c.get('asl_signatures', []),
             "embedding_mean_file": c.get('asl_embedding_mean_file'),
-            "metadata": {
-                "hands_involved": c.get('hands_involved'),
-                "pose_involvement": c.get('pose_involvement'),
-                "face_involvement": c.get('face_involvement')
-            }
+            "metadata": metadata
         }
         
         # Extract BSL data
@@ -62,34 +81,30 @@ def extract_language_registries():
             "concept_description": c.get('concept_description'),
             "target": c.get('bsl_target'),
             "embedding_mean_file": c.get('bsl_embedding_mean_file'),
-            "metadata": {
-                "hands_involved": c.get('hands_involved'),
-                "pose_involvement": c.get('pose_involvement'),
-                "face_involvement": c.get('face_involvement')
-            }
+            "metadata": metadata
         }
         
-        print(f"  ✓ {concept_id}: ASL + BSL extracted")
+        progress.append(f"  ✓ {concept_id}: ASL + BSL extracted")
+    
+    # One buffered write for the per-concept progress lines
+    if progress:
+        print("\n".join(progress))
     
     print(f"\n✅ ASL Registry: {len(asl_registry)} entries (including metadata)")
     print(f"✅ BSL Registry: {len(bsl_registry)} entries (including metadata)")
     
     return asl_registry, bsl_registry
 
-def create_refactored_translation_map():
+def create_refactored_translation_map(tmap):
     """Create concept-centric translation map without language-specific data"""
     
-    with open('translation_map.json') as f:
-        tmap = json.load(f)
-    
     # Create new refactored map
     new_tmap = {
         "_metadata": tmap.get('_metadata')
     }
     
     # Keep only concept metadata
-    concepts = [k for k in tmap.keys() if not k.startswith('_')]
-    for concept in concepts:
+    for concept in concept_keys(tmap):
         c = tmap[concept]
         concept_id = c.get('concept_id')
         
@@ -119,23 +134,31 @@ def create_refactored_translation_map():
 def verify_registries(asl_reg, bsl_reg):
     """Verify registry integrity"""
     
-    asl_concepts = {k: v for k, v in asl_reg.items() if not k.startswith('_')}
-    bsl_concepts = {k: v for k, v in bsl_reg.items() if not k.startswith('_')}
+    asl_concepts = {k: asl_reg[k] for k in concept_keys(asl_reg)}
+    bsl_concepts = {k: bsl_reg[k] for k in concept_keys(bsl_reg)}
     
     print("\n🔍 Verifying registry integrity...")
     
-    # Check all concepts have embeddings
+    def check_bsl(cid, data):
+        if not data.get('embedding_mean_file'):
+            print(f"  ⚠️  {cid}: Missing BSL embedding file")
+        if not data.get('target'):
+            print(f"  ⚠️  {cid}: Missing BSL target")
+    
+    # Check all concepts have embeddings (one joint pass; both registries
+    # share concept IDs after extraction)
     for cid, data in asl_concepts.items():
         if not data.get('embedding_mean_file'):
             print(f"  ⚠️  {cid}: Missing ASL embedding file")
         if not data.get('signatures'):
             print(f"  ⚠️  {cid}: Missing ASL signatures")
+        bsl_data = bsl_concepts.get(cid)
+        if bsl_data is not None:
+            check_bsl(cid, bsl_data)
     
-    for cid, data in bsl_concepts.items():
-        if not data.get('embedding_mean_file'):
-            print(f"  ⚠️  {cid}: Missing BSL embedding file")
-        if not data.get('target'):
-            print(f"  ⚠️  {cid}: Missing BSL target")
+    # BSL-only concepts (none after a normal extraction)
+    for cid in bsl_concepts.keys() - asl_concepts.keys():
+        check_bsl(cid, bsl_concepts[cid])
     
     print("✅ Registry verification complete")
 
@@ -144,8 +167,11 @@ if __name__ == '__main__':
     print("STEP 1: Extract Language Registries")
     print("=" * 60)
     
+    # Parse translation_map.json once; both steps share it
+    tmap = dict(iter_tmap_items())
+    
     # Extract
-    asl_reg, bsl_reg = extract_language_registries()
+    asl_reg, bsl_reg = extract_language_registries(tmap)
     
     # Verify
     verify_registries(asl_reg, bsl_reg)
@@ -154,14 +180,14 @@ if __name__ == '__main__':
     print("\n" + "=" * 60)
     print("STEP 2: Create Refactored translation_map.json")
     print("=" * 60)
-    new_tmap = create_refactored_translation_map()
+    new_tmap = create_refactored_translation_map(tmap)
     print(f"\n✅ New translation_map.json prepared: {len(new_tmap)} entries")
     
     # Don't write yet - just prepare
     print("\n" + "=" * 60)
     print("VALIDATION SUMMARY")
     print("=" * 60)
-    print(f"ASL Registry concepts: {len([k for k in asl_reg.keys() if not k.startswith('_')])}")
-    print(f"BSL Registry concepts: {len([k for k in bsl_reg.keys() if not k.startswith('_')])}")
-    print(f"Refactored translation_map: {len([k for k in new_tmap.keys() if not k.startswith('_')])} concepts")
+    print(f"ASL Registry concepts: {len(concept_keys(asl_reg))}")
+    print(f"BSL Registry concepts: {len(concept_keys(bsl_reg))}")
+    print(f"Refactored translation_map: {len(concept_keys(new_tmap))} concepts")
     print("\n✅ Ready to write files. Run with --commit to save.")
@@ -11,23 +11,32 @@ Installation:
 
 Usage:
     python3 test_socket_server.py
+    python3 test_socket_server.py --gzip   # Broadcast gzip+base64 payloads
 
 Then in another terminal:
     python3 recognition_engine_ui.py --socket-url http://localhost:5000 --debug
 """
 
+import argparse
+import base64
+import gzip
 import json
+from collections import deque
 from datetime import datetime
-from flask import Flask, render_template_string
+from flask import Flask, Response
 from flask_socketio import SocketIO, emit
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'recognition-engine-secret'
 socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Store recent events
-recent_events = []
+# Broadcast compressed 'translation_event_gz' (gzip + base64) instead of raw JSON
+# to dashboard clients; set by --gzip
+COMPRESS_BROADCAST = False
+
+# Store recent events (bounded FIFO: oldest dropped automatically)
 max_events = 20
+recent_events = deque(maxlen=max_events)
 
 # HTML dashboard for visualization
 HTML_TEMPLATE = """
@@ -36,6 +45,7 @@ HTML_TEMPLATE = """
 <head>
     <title>Socket.io Recognition Dashboard</title>
     <script src="https://cdn.socket.io/4.5.4/socket.io.min.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/pako@2.1.0/dist/pako.min.js"></script>
     <style>
         body {
             font-family: monospace;
@@ -130,7 +140,7 @@ HTML_TEMPLATE = """
             document.getElementById('status').classList.remove('connected');
         });
 
-        socket.on('translation_event', function(data) {
+        function showTranslationEvent(data) {
             console.log('Translation event:', data);
             eventCount++;
             document.getElementById('eventCount').innerText = eventCount;
@@ -154,6 +164,14 @@ HTML_TEMPLATE = """
             while (eventsDiv.children.length > 20) {
                 eventsDiv.removeChild(eventsDiv.lastChild);
             }
+        }
+
+        socket.on('translation_event', showTranslationEvent);
+
+        // Compressed variant (server --gzip): base64(gzip(JSON))
+        socket.on('translation_event_gz', function(msg) {
+            const bytes = Uint8Array.from(atob(msg), c => c.charCodeAt(0));
+            showTranslationEvent(JSON.parse(pako.ungzip(bytes, { to: 'string' })));
         });
 
         socket.on('sign_recognized', function(data) {
@@ -164,10 +182,15 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# Static page (no template variables): encode once instead of rendering per request
+HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+
 @app.route('/')
 def index():
     """Serve the dashboard."""
-    return render_template_string(HTML_TEMPLATE)
+    response = Response(HTML_BYTES, mimetype='text/html')
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 @socketio.on('connect')
 def handle_connect():
@@ -206,11 +229,14 @@ def handle_translation_event(data):
         'status': data.get('verification_status', 'unknown')
     }
     recent_events.append(event_data)
-    if len(recent_events) > max_events:
-        recent_events.pop(0)
     
     # Forward to connected UI clients (if any)
-    emit('translation_event', data, broadcast=True, skip_sid=True)
+    if COMPRESS_BROADCAST:
+        payload = gzip.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), compresslevel=1)
+        emit('translation_event_gz', base64.b64encode(payload).decode('ascii'),
+             broadcast=True, skip_sid=True)
+    else:
+        emit('translation_event', data, broadcast=True, skip_sid=True)
 
 @socketio.on('sign_recognized')
 def handle_sign_recognized(data):
@@ -221,6 +247,12 @@ def handle_sign_recognized(data):
     print(f"  Score: {data.get('score', 0):.3f}")
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Socket.io test server for the recognition engine")
+    parser.add_argument('--gzip', action='store_true',
+                        help="Broadcast translation events as gzip+base64 (translation_event_gz)")
+    args = parser.parse_args()
+    COMPRESS_BROADCAST = args.gzip
+    
     print("=" * 70)
     print("🔌 Socket.io Test Server for Recognition Engine")
     print("=" * 70)
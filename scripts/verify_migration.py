@@ -4,6 +4,8 @@
 import json
 import os
 
+from migration_step1 import concept_keys
+
 print("=" * 60)
 print("VERIFYING FILE STRUCTURE")
 print("=" * 60)
@@ -13,11 +15,11 @@ print("\n1. Checking translation_map.json (concept-centric)...")
 with open('translation_map.json') as f:
     tmap = json.load(f)
 
-concepts = [k for k in tmap.keys() if not k.startswith('_')]
-print(f"   ✓ {len(concepts)} concepts")
+tmap_ids = frozenset(concept_keys(tmap))
+print(f"   ✓ {len(tmap_ids)} concepts")
 
 # Verify no language-specific data in translation_map
-sample = tmap[concepts[0]]
+sample = tmap[concept_keys(tmap)[0]]
 bad_keys = [k for k in sample.keys() if 'asl_' in k or 'bsl_' in k]
 if bad_keys:
     print(f"   ✗ ERROR: Found language-specific keys: {bad_keys}")
@@ -39,11 +41,11 @@ if not os.path.exists('assets/registries/asl_registry.json'):
 else:
     with open('assets/registries/asl_registry.json') as f:
         asl = json.load(f)
-    asl_concepts = [k for k in asl.keys() if not k.startswith('_')]
-    print(f"   ✓ {len(asl_concepts)} concepts")
+    asl_ids = frozenset(concept_keys(asl))
+    print(f"   ✓ {len(asl_ids)} concepts")
     
     # Verify structure
-    sample_asl = asl[asl_concepts[0]]
+    sample_asl = asl[concept_keys(asl)[0]]
     if 'signatures' in sample_asl and 'embedding_mean_file' in sample_asl:
         print(f"   ✓ Proper structure (signatures + embedding)")
     else:
@@ -56,11 +58,11 @@ if not os.path.exists('assets/registries/bsl_registry.json'):
 else:
     with open('assets/registries/bsl_registry.json') as f:
         bsl = json.load(f)
-    bsl_concepts = [k for k in bsl.keys() if not k.startswith('_')]
-    print(f"   ✓ {len(bsl_concepts)} concepts")
+    bsl_ids = frozenset(concept_keys(bsl))
+    print(f"   ✓ {len(bsl_ids)} concepts")
     
     # Verify structure
-    sample_bsl = bsl[bsl_concepts[0]]
+    sample_bsl = bsl[concept_keys(bsl)[0]]
     if 'target' in sample_bsl and 'embedding_mean_file' in sample_bsl:
         print(f"   ✓ Proper structure (target + embedding)")
     else:
@@ -68,10 +70,6 @@ else:
 
 # Cross-reference check
 print("\n4. Cross-referencing registries...")
-tmap_ids = set(concepts)
-asl_ids = set(asl_concepts)
-bsl_ids = set(bsl_concepts)
-
 if tmap_ids == asl_ids == bsl_ids:
     print(f"   ✓ All registries have identical concept IDs")
 else:
@@ -6,89 +6,179 @@ Extract specific words from WLASL dataset and copy their videos to lexicon folde
 import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# orjson optional import (fast parse of the multi-MB WLASL metadata; falls back to json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Target words to extract
-TARGET_WORDS = ['HELLO', 'YOU', 'GO', 'WHERE']
+TARGET_WORDS = frozenset(('HELLO', 'YOU', 'GO', 'WHERE'))
 
 # Paths
 WLASL_JSON = 'assets/wlasl_data/WLASL_v0.3.json'
 WLASL_VIDEOS_BASE = 'assets/wlasl_data'
 OUTPUT_DIR = 'assets/raw_videos/lexicon'
 
+# Parallel copies (threads: the GIL is released during file I/O)
+COPY_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
 def find_videos_for_words(json_path, words):
     """Find video IDs for specified words in WLASL dataset."""
     print(f"Reading {json_path}...")
     
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
     
     word_videos = {}
     
+    # Case-insensitive match: lower-case targets once, map hits back to the
+    # requested upper-case word
+    lower_targets = {w.lower(): w.upper() for w in words}
+    
     for entry in data:
-        gloss = entry['gloss'].upper()
+        word = lower_targets.get(entry['gloss'].lower())
         
-        if gloss in words:
-            if gloss not in word_videos:
-                word_videos[gloss] = []
-            
+        if word is not None:
             # Extract video IDs from instances
-            for instance in entry.get('instances', []):
-                video_id = instance.get('video_id')
-                if video_id:
-                    word_videos[gloss].append(video_id)
+            word_videos.setdefault(word, []).extend(
+                video_id for instance in entry.get('instances', ())
+                if (video_id := instance.get('video_id'))
+            )
     
     return word_videos
 
-def find_video_files(video_dir, video_ids):
-    """Find .mp4 files matching video IDs in dataset folder."""
-    found_files = {}
+def _iter_mp4(root):
+    """
+    Yield os.DirEntry objects for .mp4 files under root (os.walk order).
+    
+    Uses os.scandir directly: is_dir() is answered from the directory entry,
+    so no extra stat() per file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = []
+                for entry in it:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked dirs
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.mp4'):
+                        yield entry
+        except OSError:
+            continue  # Unreadable dir (os.walk skips these too)
+        # Reversed so the first subdirectory is walked next
+        stack.extend(reversed(subdirs))
+
+def build_video_index(video_dir):
+    """Walk dataset folder once and map each .mp4 base name (video ID) to its path."""
+    index = {}
     
-    print(f"\nSearching for video files in {video_dir}...")
+    print(f"\nIndexing video files in {video_dir}...")
     
     # Common naming patterns: video_id.mp4, VIDEO_ID.mp4, etc.
-    for root, dirs, files in os.walk(video_dir):
-        for file in files:
-            if file.endswith('.mp4'):
-                # Extract video ID from filename (remove .mp4 and extension)
-                base_name = file.replace('.mp4', '')
-                
-                # Check if this ID matches any we're looking for
-                for vid_id in video_ids:
-                    if base_name == vid_id or base_name == str(vid_id):
-                        found_files[vid_id] = os.path.join(root, file)
-                        break
+    for entry in _iter_mp4(video_dir):
+        # Video ID = filename without the trailing .mp4
+        index[entry.name[:-4]] = entry.path
     
-    return found_files
+    print(f"Indexed {len(index)} video file(s)")
+    return index
 
-def copy_videos(word_videos, wlasl_base, output_dir):
-    """Copy videos to lexicon folder, organized by word."""
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+def find_video_files(video_dir, video_ids, index=None):
+    """Find .mp4 files matching video IDs in dataset folder."""
+    if index is None:
+        index = build_video_index(video_dir)
     
-    total_copied = 0
+    found_files = {}
+    for vid_id in video_ids:
+        path = index.get(str(vid_id))
+        if path is not None:
+            found_files[vid_id] = path
+    
+    return found_files
+
+def _fast_copy(src, dst):
+    """
+    Copy a video like shutil.copy2 (contents + timestamps), preferring
+    os.copy_file_range on Linux: in-kernel copy, a reflink on btrfs/XFS.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+            # Short copy (source shrank, FS stopped early): drop the partial file
+            os.remove(dst)
+        except OSError:
+            pass  # Unsupported (old kernel, cross-FS): use the portable path
+    # copy2 already uses sendfile (Linux), fcopyfile (macOS) or its own
+    # platform copy path elsewhere
+    shutil.copy2(src, dst)
+
+def _build_copy_plan(word_videos, index, output_dir):
+    """List (video_id, src, dst) copies for every indexed video; report missing IDs."""
+    plan = []
     
     for word, video_ids in sorted(word_videos.items()):
         print(f"\n{word}: {len(video_ids)} video(s)")
         
         for video_id in video_ids:
             # Find the video file
-            video_files = find_video_files(wlasl_base, [video_id])
+            src = index.get(str(video_id))
             
-            if video_id in video_files:
-                src = video_files[video_id]
+            if src is not None:
                 # Name: word_videoid.mp4
                 dst_name = f"{word}_{video_id}.mp4"
-                dst = os.path.join(output_dir, dst_name)
-                
-                try:
-                    print(f"  Copying {video_id}: {os.path.basename(src)} → {dst_name}")
-                    shutil.copy2(src, dst)
-                    total_copied += 1
-                except Exception as e:
-                    print(f"  ERROR copying {video_id}: {e}")
+                plan.append((video_id, src, os.path.join(output_dir, dst_name)))
             else:
                 print(f"  NOT FOUND: {video_id}")
     
+    return plan
+
+def copy_videos(word_videos, wlasl_base, output_dir):
+    """Copy videos to lexicon folder, organized by word."""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Walk the dataset once; every video ID is then an O(1) lookup
+    index = build_video_index(wlasl_base)
+    
+    # Plan all copies first (lookups + diagnostics), then run the I/O in parallel
+    copies = _build_copy_plan(word_videos, index, output_dir)
+    
+    total_copied = 0
+    
+    if copies:
+        print(f"\nCopying {len(copies)} video(s) with {COPY_WORKERS} workers...")
+    
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        futures = {pool.submit(_fast_copy, src, dst): (video_id, src, dst)
+                   for video_id, src, dst in copies}
+        for future in as_completed(futures):
+            video_id, src, dst = futures[future]
+            try:
+                future.result()
+                print(f"  Copied {video_id}: {os.path.basename(src)} → {os.path.basename(dst)}")
+                total_copied += 1
+            except Exception as e:
+                print(f"  ERROR copying {video_id}: {e}")
+    
     return total_copied
 
 def main():
@@ -105,7 +195,7 @@ def main():
     word_videos = find_videos_for_words(WLASL_JSON, TARGET_WORDS)
     
     if not word_videos:
-        print(f"ERROR: No videos found for {TARGET_WORDS}")
+        print(f"ERROR: No videos found for {sorted(TARGET_WORDS)}")
         return 1
     
     print(f"\nFound videos:")
@@ -32,11 +32,37 @@ RECOMMENDATIONS:
 import cv2
 import json
 import argparse
+import copy
+import hashlib
+import mmap
+import os
+import time
 import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from skeleton_drawer import SkeletonDrawer, extract_landmarks_from_signature
 
+# orjson optional import (faster parse of float-heavy signatures; falls back to json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Rendered output frames kept for replay / pause / scrubbing (LRU, bounded by bytes)
+FRAME_CACHE_BYTES = 64 * 1024 * 1024
+
+# Upcoming frames rendered on a worker thread during playback
+PREFETCH_AHEAD = 2
+PREFETCH_QUEUE_SIZE = 4
+
+# Extracted landmark frames are cached under the repo-local .cache/ (bump on format change)
+LANDMARK_CACHE_DIR = os.path.join('.cache', 'frames')
+LANDMARK_CACHE_VERSION = 1
+LANDMARK_PARTS = ('pose', 'left_hand', 'right_hand')
+
 
 class SkeletonDebugger:
     """Dual-signature visualization and validation."""
@@ -63,17 +89,21 @@ class SkeletonDebugger:
         self.lang2 = lang2
         self.side_by_side = side_by_side
         
-        # Load signatures
-        self.sig1_dict = self._load_signature(sig1_path)
-        self.sig2_dict = self._load_signature(sig2_path)
+        # Load packed landmarks (JSON parse + extraction, or the cached result)
+        packed1, frame_size = self._load_packed(self.sig1_path)
+        packed2, _ = self._load_packed(self.sig2_path)
+        self.frames1 = self._unpack_frames(packed1)
+        self.frames2 = self._unpack_frames(packed2)
         
-        # Extract landmark frames
-        self.frames1 = extract_landmarks_from_signature(self.sig1_dict)
-        self.frames2 = extract_landmarks_from_signature(self.sig2_dict)
+        # Per-signature labels / lengths used on every rendered frame
+        self._sig1_stem = self.sig1_path.stem
+        self._sig2_stem = self.sig2_path.stem
+        self._total1 = len(self.frames1)
+        self._total2 = len(self.frames2)
         
         # State
         self.current_frame = 0
-        self.max_frame = max(len(self.frames1), len(self.frames2))
+        self.max_frame = max(self._total1, self._total2)
         self.is_playing = False
         self.show_normalization = True
         self.show_joints = True
@@ -85,11 +115,109 @@ class SkeletonDebugger:
         self.normalize_display = False
         
         # Get dimensions from metadata
-        self.width = self.sig1_dict.get('metadata', {}).get('frame_width', 640)
-        self.height = self.sig1_dict.get('metadata', {}).get('frame_height', 480)
+        self.width, self.height = frame_size
+        
+        # Normalized display landmarks per signature (built on first 'n' toggle
+        # from the same packed arrays as the raw frames)
+        self._packed = {id(self.frames1): packed1, id(self.frames2): packed2}
+        self._normalized_frames = {}
+        
+        # Rendered frames keyed by display state (see _create_output_frame)
+        self._frame_cache = OrderedDict()
+        self._frame_cache_bytes = 0
+        
+        # Key code -> handler for run(); a handler returning True quits
+        self._key_handlers = {
+            ord('q'): self._on_quit,
+            ord(' '): self._on_toggle_play,
+            81: self._on_prev_frame,   # LEFT arrow
+            83: self._on_next_frame,   # RIGHT arrow
+            ord('n'): self._on_toggle_normalization,
+            ord('d'): self._on_toggle_joints,
+            ord('s'): self._on_toggle_side_by_side,
+            ord('r'): self._on_replay,
+        }
+        
+        # Pending (state key, future) renders; pool only exists inside run()
+        self._prefetch_pool = None
+        self._prefetch = deque(maxlen=PREFETCH_QUEUE_SIZE)
+    
+    def _load_packed(self, path: Path) -> Tuple[Dict[str, np.ndarray], Tuple[int, int]]:
+        """
+        Packed landmark arrays + (frame_width, frame_height) metadata for a signature.
+        
+        The packed arrays are cached in LANDMARK_CACHE_DIR as one .npz per
+        signature, storing a key over the JSON's path, mtime and size; a
+        stale or unreadable cache is rebuilt in place, so restarts skip the
+        JSON parse without leaving old files behind.
+        """
+        resolved = str(Path(path).resolve())
+        st = os.stat(path)
+        key = f"{resolved}:{st.st_mtime_ns}:{st.st_size}:{LANDMARK_CACHE_VERSION}"
+        path_id = hashlib.sha1(resolved.encode()).hexdigest()[:16]
+        cache_path = os.path.join(LANDMARK_CACHE_DIR, f"{Path(path).stem}_{path_id}.npz")
+        
+        if os.path.exists(cache_path):
+            try:
+                with np.load(cache_path) as cached:
+                    if str(cached['key']) == key:
+                        packed = {name: cached[name] for name in cached.files if name != 'key'}
+                        return packed, tuple(packed.pop('frame_size').tolist())
+            except (OSError, KeyError, ValueError):
+                pass  # Unreadable cache: rebuild below
+        
+        sig_dict = self._load_signature(path)
+        packed = self._pack_frames(extract_landmarks_from_signature(sig_dict))
+        metadata = sig_dict.get('metadata', {})
+        frame_size = (metadata.get('frame_width', 640), metadata.get('frame_height', 480))
+        
+        try:
+            os.makedirs(LANDMARK_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp_path, key=np.array(key), frame_size=np.array(frame_size), **packed)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️  Could not write landmark cache: {e}")
+        
+        return packed, frame_size
+    
+    @staticmethod
+    def _pack_frames(frames: List) -> Dict[str, np.ndarray]:
+        """Flatten per-frame landmark dicts into per-part point arrays + per-frame counts."""
+        arrays = {}
+        for part in LANDMARK_PARTS:
+            chunks = [lm[part] for lm in frames if part in lm]
+            arrays[f"{part}_counts"] = np.array([len(lm[part]) if part in lm else 0 for lm in frames])
+            arrays[f"{part}_points"] = (np.concatenate(chunks) if chunks
+                                        else np.zeros((0, 3), dtype=np.float32))
+        return arrays
+    
+    @staticmethod
+    def _unpack_frames(packed: Dict[str, np.ndarray]) -> List:
+        """Inverse of _pack_frames (a part with count 0 is absent from that frame)."""
+        parts = {}
+        for part in LANDMARK_PARTS:
+            counts = packed[f"{part}_counts"]
+            parts[part] = (counts, np.split(packed[f"{part}_points"], np.cumsum(counts)[:-1]))
+        
+        num_frames = len(parts[LANDMARK_PARTS[0]][0])
+        frames = [{} for _ in range(num_frames)]
+        for part, (counts, chunks) in parts.items():
+            for lm, count, points in zip(frames, counts, chunks):
+                if count:
+                    lm[part] = points
+        return frames
     
     def _load_signature(self, path: str) -> Dict:
-        """Load signature JSON file."""
+        """Load signature JSON file (orjson parses straight from an mmap of the file)."""
+        if HAS_ORJSON:
+            with open(path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # Empty file cannot be mapped
+                    return orjson.loads(f.read())
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
         with open(path, 'r') as f:
             return json.load(f)
     
@@ -100,30 +228,68 @@ class SkeletonDebugger:
     def _get_current_landmarks(self, frame_idx: int, sig_frames: List) -> Dict:
         """Get landmarks for frame, or empty dict if out of range."""
         if 0 <= frame_idx < len(sig_frames):
-            landmarks = sig_frames[frame_idx]
-            
             if self.normalize_display:
-                # Apply body-centric normalization for visual comparison
-                landmarks = SkeletonDrawer.normalize_landmarks(landmarks)
-                
-                # Translate back to frame center for visibility
-                center_x = self.width // 2
-                center_y = self.height // 2
-                
-                normalized = {}
-                for key in landmarks:
-                    if landmarks[key] is not None:
-                        points = landmarks[key].copy()
-                        points[:, 0] += center_x  # Translate X
-                        points[:, 1] += center_y  # Translate Y
-                        normalized[key] = points
-                
-                return normalized
+                return self._get_normalized_frames(sig_frames)[frame_idx]
             else:
-                return landmarks
+                return sig_frames[frame_idx]
         
         return {}
     
+    def _get_normalized_frames(self, sig_frames: List) -> List:
+        """Display-normalized landmarks for every frame (computed once per signature)."""
+        key = id(sig_frames)
+        if key not in self._normalized_frames:
+            self._normalized_frames[key] = self._unpack_frames(
+                self._normalize_packed(self._packed[key])
+            )
+        return self._normalized_frames[key]
+    
+    def _normalize_packed(self, packed: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Body-centric normalization (SkeletonDrawer.normalize_landmarks) for all
+        frames at once, then centred in the frame.
+        
+        Pose is shifted by its per-frame shoulder midpoint (frames with <= 12 pose
+        points drop their pose), hands by the shifted wrist when the pose has one.
+        """
+        offset = np.array([self.width // 2, self.height // 2], dtype=np.float32)
+        
+        pose_counts = packed['pose_counts']
+        pose_points = packed['pose_points']
+        starts = np.cumsum(pose_counts) - pose_counts
+        has_center = pose_counts > 12
+        
+        # Per-frame shoulder midpoint (indices 11, 12)
+        center = np.zeros((len(pose_counts), 2), dtype=pose_points.dtype)
+        center[has_center] = (pose_points[starts[has_center] + 11, :2] +
+                              pose_points[starts[has_center] + 12, :2]) / 2
+        
+        point_frame = np.repeat(np.arange(len(pose_counts)), pose_counts)
+        keep = has_center[point_frame]
+        pose = pose_points[keep].copy()
+        pose[:, :2] = pose[:, :2] - center[point_frame[keep]]
+        pose[:, :2] += offset
+        
+        result = {
+            'pose_counts': np.where(has_center, pose_counts, 0),
+            'pose_points': pose,
+        }
+        
+        # Hands relative to the normalized wrist (15 = left, 16 = right)
+        for part, wrist_idx in (('left_hand', 15), ('right_hand', 16)):
+            counts = packed[f"{part}_counts"]
+            has_wrist = has_center & (pose_counts > wrist_idx)
+            wrist = np.zeros_like(center)
+            wrist[has_wrist] = pose_points[starts[has_wrist] + wrist_idx, :2] - center[has_wrist]
+            
+            hand = packed[f"{part}_points"].copy()
+            hand[:, :2] = hand[:, :2] - np.repeat(wrist, counts, axis=0)
+            hand[:, :2] += offset
+            result[f"{part}_counts"] = counts
+            result[f"{part}_points"] = hand
+        
+        return result
+    
     def _draw_frame_info(self, frame: np.ndarray, frame_num: int, total: int, 
                         sig_name: str, lang: str) -> None:
         """Draw metadata on frame."""
@@ -150,19 +316,14 @@ class SkeletonDebugger:
         Returns:
             Normalized landmarks dict
         """
-        # Collect all points
-        all_points = []
-        if landmarks.get('pose') is not None:
-            all_points.extend(landmarks['pose'][:, :2])
-        if landmarks.get('left_hand') is not None:
-            all_points.extend(landmarks['left_hand'][:, :2])
-        if landmarks.get('right_hand') is not None:
-            all_points.extend(landmarks['right_hand'][:, :2])
-        
-        if not all_points:
-            return landmarks  # No points to normalize
+        # Collect all points (one concatenate, no per-row Python copies)
+        parts = [landmarks[key][:, :2] for key in ('pose', 'left_hand', 'right_hand')
+                 if landmarks.get(key) is not None]
+        
+        all_points = np.concatenate(parts) if parts else None
         
-        all_points = np.array(all_points)
+        if all_points is None or not len(all_points):
+            return landmarks  # No points to normalize
         
         # Compute bounding box
         min_x, min_y = all_points.min(axis=0)
@@ -201,7 +362,7 @@ class SkeletonDebugger:
         """Draw synchronization info on frame."""
         h, w = frame.shape[:2]
         
-        frame_diff = len(self.frames1) - len(self.frames2)
+        frame_diff = self._total1 - self._total2
         status = "✓ SYNC" if frame_diff == 0 else f"⚠ DESYNC ({frame_diff} frames)"
         color = (0, 255, 0) if frame_diff == 0 else (0, 165, 255)
         
@@ -217,12 +378,67 @@ class SkeletonDebugger:
         cv2.putText(frame, status, (w - 200, 30), cv2.FONT_HERSHEY_SIMPLEX,
                    0.6, color, 2)
     
+    def _state_key(self) -> Tuple:
+        """Display state that fully determines the rendered output frame."""
+        return (self.current_frame, self.normalize_display, self.show_joints,
+                self.side_by_side, self.completed_lang1, self.completed_lang2)
+    
+    def _render_state(self, key: Tuple) -> np.ndarray:
+        """Render the output frame for a state key (safe to call off the main thread)."""
+        view = copy.copy(self)
+        (view.current_frame, view.normalize_display, view.show_joints,
+         view.side_by_side, view.completed_lang1, view.completed_lang2) = key
+        
+        if view.side_by_side:
+            return view._create_side_by_side()
+        return view._create_single()
+    
     def _create_output_frame(self) -> np.ndarray:
-        """Create current output frame(s)."""
-        if self.side_by_side:
-            return self._create_side_by_side()
+        """Create current output frame(s), reusing a cached or prefetched render for the same display state."""
+        key = self._state_key()
+        output = self._frame_cache.get(key)
+        if output is not None:
+            self._frame_cache.move_to_end(key)
+            return output
+        
+        for pending in self._prefetch:
+            if pending[0] == key:
+                self._prefetch.remove(pending)
+                output = pending[1].result()
+                break
         else:
-            return self._create_single()
+            output = self._render_state(key)
+        
+        self._frame_cache[key] = output
+        self._frame_cache_bytes += output.nbytes
+        while self._frame_cache_bytes > FRAME_CACHE_BYTES and len(self._frame_cache) > 1:
+            self._frame_cache_bytes -= self._frame_cache.popitem(last=False)[1].nbytes
+        return output
+    
+    def _prefetch_upcoming(self) -> None:
+        """Queue renders for the next PREFETCH_AHEAD playback frames on the worker."""
+        wanted = []
+        frame, done1, done2 = self.current_frame, self.completed_lang1, self.completed_lang2
+        for _ in range(PREFETCH_AHEAD):
+            # Mirrors the auto-advance in run()
+            done1 = done1 or frame >= self._total1
+            done2 = done2 or frame >= self._total2
+            frame += 1
+            if frame > self.max_frame - 1:
+                break
+            wanted.append((frame, self.normalize_display, self.show_joints,
+                           self.side_by_side, done1, done2))
+        
+        # Drop renders for states we will no longer show
+        for pending in list(self._prefetch):
+            if pending[0] not in wanted:
+                pending[1].cancel()
+                self._prefetch.remove(pending)
+        
+        pending_keys = {pending[0] for pending in self._prefetch}
+        for key in wanted:
+            if key not in self._frame_cache and key not in pending_keys:
+                self._prefetch.append((key, self._prefetch_pool.submit(self._render_state, key)))
     
     def _create_single(self) -> np.ndarray:
         """Create single-screen visualization (non-toggled).
@@ -235,8 +451,8 @@ class SkeletonDebugger:
         # Show sig1
         lm = self._get_current_landmarks(self.current_frame, self.frames1)
         lang = self.lang1
-        sig_name = self.sig1_path.stem
-        total = len(self.frames1)
+        sig_name = self._sig1_stem
+        total = self._total1
         
         if lm:
             frame_blank = SkeletonDrawer.draw_skeleton(
@@ -259,9 +475,11 @@ class SkeletonDebugger:
         
         Note: High CPU cost. Recommended to use single-screen mode first.
         """
-        # Create full-size canvases for each skeleton
-        frame1_blank = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        frame2_blank = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        # One side-by-side canvas; each skeleton is drawn straight into its half
+        # (no separate per-side frames and no np.hstack copy)
+        combined = np.zeros((self.height, 2 * self.width, 3), dtype=np.uint8)
+        frame1_blank = combined[:, :self.width]
+        frame2_blank = combined[:, self.width:]
         
         # Get landmarks for current frame
         lm1 = self._get_current_landmarks(self.current_frame, self.frames1)
@@ -270,46 +488,43 @@ class SkeletonDebugger:
         # Normalize both to standard bounding box (makes them same relative size)
         if lm1:
             lm1_normalized = self._normalize_landmarks_to_bbox(lm1, target_width=0.7)
-            frame1_blank = SkeletonDrawer.draw_skeleton(
+            SkeletonDrawer.draw_skeleton(
                 frame1_blank, lm1_normalized, lang=self.lang1,
-                show_joints=self.show_joints
+                show_joints=self.show_joints, inplace=True
             )
         
         if lm2:
             lm2_normalized = self._normalize_landmarks_to_bbox(lm2, target_width=0.7)
-            frame2_blank = SkeletonDrawer.draw_skeleton(
+            SkeletonDrawer.draw_skeleton(
                 frame2_blank, lm2_normalized, lang=self.lang2,
-                show_joints=self.show_joints
+                show_joints=self.show_joints, inplace=True
             )
         
         # Add info (normalized size)
         # Frame info with completion indicator for lang1
         lang1_indicator = "⏹" if self.completed_lang1 else "▶"
-        cv2.putText(frame1_blank, f"{lang1_indicator} {self.lang1} | Frame {self.current_frame + 1}/{len(self.frames1)}", 
+        cv2.putText(frame1_blank, f"{lang1_indicator} {self.lang1} | Frame {self.current_frame + 1}/{self._total1}", 
                    (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-        cv2.putText(frame1_blank, f"Sig: {self.sig1_path.stem}", 
+        cv2.putText(frame1_blank, f"Sig: {self._sig1_stem}", 
                    (5, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1)
         
         # Show "ended" if video is out of bounds
-        if self.current_frame >= len(self.frames1):
+        if self.current_frame >= self._total1:
             cv2.putText(frame1_blank, "[Video ended]", (10, 150), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (100, 100, 100), 1)
         
         # Frame info with completion indicator for lang2
         lang2_indicator = "⏹" if self.completed_lang2 else "▶"
-        cv2.putText(frame2_blank, f"{lang2_indicator} {self.lang2} | Frame {self.current_frame + 1}/{len(self.frames2)}", 
+        cv2.putText(frame2_blank, f"{lang2_indicator} {self.lang2} | Frame {self.current_frame + 1}/{self._total2}", 
                    (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-        cv2.putText(frame2_blank, f"Sig: {self.sig2_path.stem}", 
+        cv2.putText(frame2_blank, f"Sig: {self._sig2_stem}", 
                    (5, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1)
         
         # Show "ended" if video is out of bounds
-        if self.current_frame >= len(self.frames2):
+        if self.current_frame >= self._total2:
             cv2.putText(frame2_blank, "[Video ended]", (10, 150), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (100, 100, 100), 1)
         
-        # Combine side-by-side
-        combined = np.hstack([frame1_blank, frame2_blank])
-        
         # Add unified info
         self._draw_sync_info(combined)
         self._draw_normalization_info(combined)
@@ -331,13 +546,13 @@ class SkeletonDebugger:
         if show_sig1:
             lm = self._get_current_landmarks(self.current_frame, self.frames1)
             lang = self.lang1
-            sig_name = self.sig1_path.stem
-            total = len(self.frames1)
+            sig_name = self._sig1_stem
+            total = self._total1
         else:
             lm = self._get_current_landmarks(self.current_frame, self.frames2)
             lang = self.lang2
-            sig_name = self.sig2_path.stem
-            total = len(self.frames2)
+            sig_name = self._sig2_stem
+            total = self._total2
         
         if lm:
             frame_blank = SkeletonDrawer.draw_skeleton(
@@ -357,15 +572,15 @@ class SkeletonDebugger:
     
     def run(self, fps: int = 15) -> None:
         """Run interactive debugger."""
-        frame_delay = max(1, int(1000 / fps))
+        frame_period = 1.0 / fps
         window_name = "Skeleton Debugger"
         cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
         
         print(f"\n{'='*60}")
         print(f"Skeleton Debugger")
         print(f"{'='*60}")
-        print(f"Signature 1: {self.sig1_path.stem} ({len(self.frames1)} frames)")
-        print(f"Signature 2: {self.sig2_path.stem} ({len(self.frames2)} frames)")
+        print(f"Signature 1: {self._sig1_stem} ({self._total1} frames)")
+        print(f"Signature 2: {self._sig2_stem} ({self._total2} frames)")
         print(f"Display mode: {'Side-by-side' if self.side_by_side else 'Toggled'}")
         print(f"Normalization: {'ON' if self.normalize_display else 'OFF'}")
         print(f"\nControls:")
@@ -378,43 +593,109 @@ class SkeletonDebugger:
         print(f"  'q': Quit")
         print(f"{'='*60}\n")
         
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            self._prefetch_pool = pool
+            try:
+                self._run_loop(window_name, frame_period)
+            finally:
+                for _, future in self._prefetch:
+                    future.cancel()
+                self._prefetch.clear()
+                self._prefetch_pool = None
+        
+        cv2.destroyAllWindows()
+        print("\nDebugger closed.")
+    
+    def _on_quit(self) -> bool:
+        """'q': quit."""
+        return True
+    
+    def _on_toggle_play(self) -> None:
+        """SPACE: play/pause."""
+        self.is_playing = not self.is_playing
+    
+    def _on_prev_frame(self) -> None:
+        """LEFT arrow: step back one frame and pause."""
+        self.current_frame = max(0, self.current_frame - 1)
+        self.is_playing = False
+    
+    def _on_next_frame(self) -> None:
+        """RIGHT arrow: step forward one frame and pause."""
+        self.current_frame = min(self.max_frame - 1, self.current_frame + 1)
+        self.is_playing = False
+    
+    def _on_toggle_normalization(self) -> None:
+        """'n': toggle normalization."""
+        self.normalize_display = not self.normalize_display
+    
+    def _on_toggle_joints(self) -> None:
+        """'d': toggle joint dots."""
+        self.show_joints = not self.show_joints
+    
+    def _on_toggle_side_by_side(self) -> None:
+        """'s': toggle side-by-side mode."""
+        self.side_by_side = not self.side_by_side
+    
+    def _on_replay(self) -> None:
+        """'r': replay from start."""
+        self.current_frame = 0
+        self.is_playing = True
+        self.completed_lang1 = False
+        self.completed_lang2 = False
+        print("▶ Replay from start")
+    
+    @staticmethod
+    def _poll_key(deadline: float) -> int:
+        """First key pressed before the monotonic deadline, or 255 if none."""
+        while True:
+            key = cv2.pollKey()
+            if key != -1:
+                return key & 0xFF
+            if time.monotonic() >= deadline:
+                return 255
+            time.sleep(0.001)
+    
+    def _run_loop(self, window_name: str, frame_period: float) -> None:
+        """Main display/input loop (upcoming frames render on the prefetch worker)."""
+        shown_state = None  # State currently on screen
+        next_frame_at = time.monotonic()
+        
         while True:
-            # Render frame
-            output = self._create_output_frame()
-            cv2.imshow(window_name, output)
+            # Render frame only when the display state changed (the window keeps
+            # the last image); usually already prefetched while playing
+            state = self._state_key()
+            if state != shown_state:
+                output = self._create_output_frame()
+                cv2.imshow(window_name, output)
+                shown_state = state
+                if self.is_playing:
+                    self._prefetch_upcoming()
             
-            # Handle input
-            key = cv2.waitKey(frame_delay) & 0xFF
+            # Handle input: when paused nothing changes until a key is pressed,
+            # so block on waitKey(0); while playing poll until the next frame is
+            # due (render time comes out of the frame budget, not on top of it)
+            if self.is_playing:
+                next_frame_at = max(next_frame_at + frame_period, time.monotonic())
+                key = self._poll_key(next_frame_at)
+            else:
+                key = cv2.waitKey(0) & 0xFF
+                next_frame_at = time.monotonic()
+            
+            # No key: waitKey(0)/pollKey return -1 at once after the window is
+            # closed, which would otherwise spin (paused) or play on unseen
+            if key == 255 and cv2.getWindowProperty(window_name, cv2.WND_PROP_VISIBLE) < 1:
+                break
             
-            if key == ord('q'):
+            handler = self._key_handlers.get(key)
+            if handler is not None and handler():
                 break
-            elif key == ord(' '):  # Space: play/pause
-                self.is_playing = not self.is_playing
-            elif key == 81:  # LEFT arrow
-                self.current_frame = max(0, self.current_frame - 1)
-                self.is_playing = False
-            elif key == 83:  # RIGHT arrow
-                self.current_frame = min(self.max_frame - 1, self.current_frame + 1)
-                self.is_playing = False
-            elif key == ord('n'):  # Toggle normalization
-                self.normalize_display = not self.normalize_display
-            elif key == ord('d'):  # Toggle dots
-                self.show_joints = not self.show_joints
-            elif key == ord('s'):  # Toggle side-by-side
-                self.side_by_side = not self.side_by_side
-            elif key == ord('r'):  # Replay from start
-                self.current_frame = 0
-                self.is_playing = True
-                self.completed_lang1 = False
-                self.completed_lang2 = False
-                print("▶ Replay from start")
             
             # Auto-advance if playing
             if self.is_playing:
                 # Check if either video has completed (for display indicators)
-                if self.current_frame >= len(self.frames1):
+                if self.current_frame >= self._total1:
                     self.completed_lang1 = True
-                if self.current_frame >= len(self.frames2):
+                if self.current_frame >= self._total2:
                     self.completed_lang2 = True
                 
                 # Advance to next frame if we haven't reached max yet
@@ -424,9 +705,6 @@ class SkeletonDebugger:
                     # Both videos have finished
                     self.is_playing = False
                     print(f"⏹ Playback complete")
-        
-        cv2.destroyAllWindows()
-        print("\nDebugger closed.")
 
 
 def main():
@@ -51,6 +51,7 @@ class SkeletonDrawer:
         # Partial pose connections (for 6-landmark signatures)
         (0, 1), (0, 2), (1, 3), (2, 4), (3, 5),  # Basic skeleton (no wrist-to-wrist line)
     ]
+    POSE_EDGES = np.array(POSE_CONNECTIONS, dtype=np.intp)  # (E, 2) index table
     
     # Hand connections (per hand: 21 landmarks)
     # 0=wrist, 1-4=thumb, 5-8=index, 9-12=middle, 13-16=ring, 17-20=pinky
@@ -66,6 +67,7 @@ class SkeletonDrawer:
         # Pinky
         (0, 17), (17, 18), (18, 19), (19, 20),
     ]
+    HAND_EDGES = np.array(HAND_CONNECTIONS, dtype=np.intp)  # (20, 2) index table
     
     # Colors for visualization (BGR)
     COLOR_POSE = (0, 255, 0)      # Green for body
@@ -83,7 +85,8 @@ class SkeletonDrawer:
         landmarks: Dict[str, np.ndarray],
         lang: str = "ASL",
         show_joints: bool = True,
-        show_confidence: bool = False
+        show_confidence: bool = False,
+        inplace: bool = False
     ) -> np.ndarray:
         """
         Draw 2D skeleton on frame from MediaPipe landmarks.
@@ -95,77 +98,41 @@ class SkeletonDrawer:
             lang: Language label for display (ASL/BSL)
             show_joints: Draw circles at joint positions
             show_confidence: Print confidence scores (if available)
+            inplace: Draw directly on frame (e.g. a view of a larger canvas)
         
         Returns:
             frame with skeleton drawn
         """
-        frame = frame.copy()
-        h, w = frame.shape[:2]
+        if not inplace:
+            frame = frame.copy()
         
         # Draw pose skeleton (body)
         if 'pose' in landmarks and landmarks['pose'] is not None:
-            pose = landmarks['pose']
-            for idx1, idx2 in SkeletonDrawer.POSE_CONNECTIONS:
-                if idx1 < len(pose) and idx2 < len(pose):
-                    pt1 = tuple(map(int, pose[idx1][:2]))
-                    pt2 = tuple(map(int, pose[idx2][:2]))
-                    
-                    # Validity check (ensure points are within frame)
-                    if SkeletonDrawer._is_valid_point(pt1, h, w) and \
-                       SkeletonDrawer._is_valid_point(pt2, h, w):
-                        cv2.line(frame, pt1, pt2, 
-                                SkeletonDrawer.COLOR_POSE, 
-                                SkeletonDrawer.THICKNESS_LINE)
+            pose = SkeletonDrawer._to_pixels(landmarks['pose'])
+            SkeletonDrawer._draw_connections(frame, pose, SkeletonDrawer.POSE_EDGES,
+                                             SkeletonDrawer.COLOR_POSE)
             
             # Draw joints
             if show_joints:
-                for point in pose:
-                    pt = tuple(map(int, point[:2]))
-                    if SkeletonDrawer._is_valid_point(pt, h, w):
-                        cv2.circle(frame, pt, SkeletonDrawer.JOINT_RADIUS,
-                                  SkeletonDrawer.COLOR_JOINT, -1)
+                SkeletonDrawer._draw_joints(frame, pose, SkeletonDrawer.COLOR_JOINT)
         
         # Draw left hand skeleton
         if 'left_hand' in landmarks and landmarks['left_hand'] is not None:
-            left_hand = landmarks['left_hand']
-            for idx1, idx2 in SkeletonDrawer.HAND_CONNECTIONS:
-                if idx1 < len(left_hand) and idx2 < len(left_hand):
-                    pt1 = tuple(map(int, left_hand[idx1][:2]))
-                    pt2 = tuple(map(int, left_hand[idx2][:2]))
-                    
-                    if SkeletonDrawer._is_valid_point(pt1, h, w) and \
-                       SkeletonDrawer._is_valid_point(pt2, h, w):
-                        cv2.line(frame, pt1, pt2,
-                                SkeletonDrawer.COLOR_LEFT_HAND,
-                                SkeletonDrawer.THICKNESS_LINE)
+            left_hand = SkeletonDrawer._to_pixels(landmarks['left_hand'])
+            SkeletonDrawer._draw_connections(frame, left_hand, SkeletonDrawer.HAND_EDGES,
+                                             SkeletonDrawer.COLOR_LEFT_HAND)
             
             if show_joints:
-                for point in left_hand:
-                    pt = tuple(map(int, point[:2]))
-                    if SkeletonDrawer._is_valid_point(pt, h, w):
-                        cv2.circle(frame, pt, SkeletonDrawer.JOINT_RADIUS,
-                                  SkeletonDrawer.COLOR_LEFT_HAND, -1)
+                SkeletonDrawer._draw_joints(frame, left_hand, SkeletonDrawer.COLOR_LEFT_HAND)
         
         # Draw right hand skeleton
         if 'right_hand' in landmarks and landmarks['right_hand'] is not None:
-            right_hand = landmarks['right_hand']
-            for idx1, idx2 in SkeletonDrawer.HAND_CONNECTIONS:
-                if idx1 < len(right_hand) and idx2 < len(right_hand):
-                    pt1 = tuple(map(int, right_hand[idx1][:2]))
-                    pt2 = tuple(map(int, right_hand[idx2][:2]))
-                    
-                    if SkeletonDrawer._is_valid_point(pt1, h, w) and \
-                       SkeletonDrawer._is_valid_point(pt2, h, w):
-                        cv2.line(frame, pt1, pt2,
-                                SkeletonDrawer.COLOR_RIGHT_HAND,
-                                SkeletonDrawer.THICKNESS_LINE)
+            right_hand = SkeletonDrawer._to_pixels(landmarks['right_hand'])
+            SkeletonDrawer._draw_connections(frame, right_hand, SkeletonDrawer.HAND_EDGES,
+                                             SkeletonDrawer.COLOR_RIGHT_HAND)
             
             if show_joints:
-                for point in right_hand:
-                    pt = tuple(map(int, point[:2]))
-                    if SkeletonDrawer._is_valid_point(pt, h, w):
-                        cv2.circle(frame, pt, SkeletonDrawer.JOINT_RADIUS,
-                                  SkeletonDrawer.COLOR_RIGHT_HAND, -1)
+                SkeletonDrawer._draw_joints(frame, right_hand, SkeletonDrawer.COLOR_RIGHT_HAND)
         
         # Add language label
         cv2.putText(frame, lang, (10, 30), cv2.FONT_HERSHEY_SIMPLEX,
@@ -174,10 +141,36 @@ class SkeletonDrawer:
         return frame
     
     @staticmethod
-    def _is_valid_point(pt: Tuple[int, int], h: int, w: int) -> bool:
-        """Check if point is within frame bounds."""
-        x, y = pt
-        return 0 <= x < w and 0 <= y < h
+    def _to_pixels(points: np.ndarray) -> np.ndarray:
+        """(N, 2) int32 pixel coordinates, truncated like int() (one vectorized cast per part)."""
+        return np.asarray(points)[:, :2].astype(np.int32)
+    
+    @staticmethod
+    def _draw_connections(frame: np.ndarray, pts: np.ndarray,
+                          edges: np.ndarray, color: Tuple[int, int, int]) -> None:
+        """Draw every in-frame connection with a single cv2.polylines call."""
+        h, w = frame.shape[:2]
+        
+        # Same rules as per-edge drawing: both indices exist, both ends in frame
+        edges = edges[(edges < len(pts)).all(axis=1)]
+        x, y = pts[:, 0], pts[:, 1]
+        in_frame = (x >= 0) & (x < w) & (y >= 0) & (y < h)
+        segments = pts[edges[in_frame[edges].all(axis=1)]]
+        
+        if len(segments):
+            cv2.polylines(frame, list(segments), False, color,
+                          SkeletonDrawer.THICKNESS_LINE)
+    
+    @staticmethod
+    def _draw_joints(frame: np.ndarray, pts: np.ndarray,
+                     color: Tuple[int, int, int]) -> None:
+        """Draw a dot at every in-frame joint (bounds tested in one NumPy pass)."""
+        h, w = frame.shape[:2]
+        x, y = pts[:, 0], pts[:, 1]
+        in_frame = (x >= 0) & (x < w) & (y >= 0) & (y < h)
+        
+        for pt in pts[in_frame].tolist():
+            cv2.circle(frame, tuple(pt), SkeletonDrawer.JOINT_RADIUS, color, -1)
     
     @staticmethod
     def normalize_landmarks(landmarks: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
@@ -130,32 +130,36 @@ class SkeletonSmoother:
         if len(trajectory) == 0:
             return trajectory
         
-        # Initialize Kalman filter state
-        x_est = np.zeros_like(trajectory)
-        x_est[0] = trajectory[0]
-        
         # Process and measurement noise covariances
         q = self.config.kalman_process_noise  # Process noise
         r = self.config.kalman_measurement_noise  # Measurement noise
         
-        p_est = np.ones(2) * r  # Initial error estimate
-        
-        for i in range(1, len(trajectory)):
-            # Prediction step
-            x_pred = x_est[i - 1]  # Assume constant velocity model (zero acceleration)
+        # The recurrence is inherently sequential, so run it on plain Python
+        # floats: per-step NumPy calls on 2-element arrays cost far more than
+        # the arithmetic. Both axes share one error estimate (same q, r, start).
+        points = trajectory.tolist()
+        outliers = np.asarray(outlier_mask, dtype=bool).tolist()
+        x, y = points[0]
+        estimates = [(x, y)]
+        p_est = r  # Initial error estimate
+        
+        for i in range(1, len(points)):
+            # Prediction step: assume constant velocity model (zero acceleration)
             p_pred = p_est + q
             
             # Update step (only if not outlier)
-            if not outlier_mask[i]:
-                measurement = trajectory[i]
+            if not outliers[i]:
+                mx, my = points[i]
                 k = p_pred / (p_pred + r)  # Kalman gain
-                x_est[i] = x_pred + k * (measurement - x_pred)
+                x = x + k * (mx - x)
+                y = y + k * (my - y)
                 p_est = (1 - k) * p_pred
             else:
                 # For outliers, use predicted value (smoothly extrapolate)
-                x_est[i] = x_pred
                 p_est = p_pred
+            estimates.append((x, y))
         
+        x_est = np.array(estimates, dtype=trajectory.dtype)
         return x_est
     
     def smooth_landmarks(self, landmarks: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Slotted Dataclass Helper
+========================
+
+Backport of @dataclass(slots=True) (Python 3.10+) for the supported 3.8+:
+__slots__ is derived from the class annotations, so field names are never
+listed twice.
+
+Usage:
+    from utils.dataclass_slots import slotted_dataclass
+
+    @slotted_dataclass
+    class Point:
+        x: float
+        y: float
+"""
+
+from dataclasses import dataclass
+
+
+def slotted_dataclass(cls):
+    """Apply @dataclass and rebuild the class with __slots__ for its fields."""
+    cls = dataclass(cls)
+    field_names = tuple(cls.__dataclass_fields__)
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)  # Class attributes would shadow the slot descriptors
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
@@ -36,7 +36,7 @@ class RegistryLoader:
     def __init__(self, base_dir: str = '.'):
         """Initialize registry loader."""
         self.base_dir = base_dir
-        self._cache = {}  # Cache loaded registries
+        self._cache = {}  # registry_type -> (mtime_ns, registry); reloaded when the file changes
     
     def _resolve_path(self, registry_type: str) -> str:
         """Resolve path for a registry type."""
@@ -45,6 +45,25 @@ class RegistryLoader:
             raise ValueError(f"Unknown registry type: {registry_type}")
         return os.path.join(self.base_dir, path)
     
+    def _load_cached(self, registry_type: str, label: str) -> Dict[str, Any]:
+        """Load a registry, re-parsing only when its file mtime has changed."""
+        path = self._resolve_path(registry_type)
+        
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{label} not found: {path}") from None
+        
+        cached = self._cache.get(registry_type)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        with open(path) as f:
+            registry = json.load(f)
+        
+        self._cache[registry_type] = (mtime_ns, registry)
+        return registry
+    
     def get_language_registry(self, language: str) -> Dict[str, Any]:
         """
         Load language-specific registry (ASL, BSL, etc).
@@ -55,19 +74,7 @@ class RegistryLoader:
         Returns:
             Dict with language data
         """
-        if language in self._cache:
-            return self._cache[language]
-        
-        path = self._resolve_path(language)
-        
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Registry not found: {path}")
-        
-        with open(path) as f:
-            registry = json.load(f)
-        
-        self._cache[language] = registry
-        return registry
+        return self._load_cached(language, "Registry")
     
     def get_concept_registry(self) -> Dict[str, Any]:
         """
@@ -76,19 +83,7 @@ class RegistryLoader:
         Returns:
             Dict with concept metadata
         """
-        if 'concepts' in self._cache:
-            return self._cache['concepts']
-        
-        path = self._resolve_path('concepts')
-        
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Concept registry not found: {path}")
-        
-        with open(path) as f:
-            registry = json.load(f)
-        
-        self._cache['concepts'] = registry
-        return registry
+        return self._load_cached('concepts', "Concept registry")
     
     def get_signatures(self, language: str, concept_id: str) -> List[Dict]:
         """
@@ -60,16 +60,48 @@ class SignatureVerifier:
         self.pose_data = self.signature.get("pose_data", [])
         self.metadata = self.signature.get("metadata", {})
 
+        # Every landmark group stacked once: {group: (point_frame, point_zero)}
+        self._group_points = self._stack_groups()
+        # Per-frame "no detection at all" mask, derived from the stacked groups
+        self._zero_frame_mask = self._build_zero_frame_mask()
+
         print(f"✅ Loaded signature: {self.sign_name} ({self.language})")
         print(f"   Total frames: {len(self.pose_data)}")
 
-    def _is_frame_zero_filled(self, frame: Dict) -> bool:
+    def _stack_groups(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Stack each landmark group's points across all frames into one array.
+
+        Returns {group: (point_frame, point_zero)}: the frame index of every
+        point and whether that point is all zeros (no detection).
+        """
+        chunks = {}
+        for frame_idx, frame in enumerate(self.pose_data):
+            for group_name, points in frame.items():
+                if points:
+                    chunks.setdefault(group_name, ([], []))
+                    chunks[group_name][0].append(frame_idx)
+                    chunks[group_name][1].append(points)
+
+        stacked = {}
+        for group_name, (frame_ids, groups) in chunks.items():
+            counts = [len(points) for points in groups]
+            coords = np.array([point for points in groups for point in points], dtype=np.float32)
+            point_frame = np.repeat(frame_ids, counts)
+            point_zero = ~coords.reshape(len(coords), -1).any(axis=1)
+            stacked[group_name] = (point_frame, point_zero)
+        return stacked
+
+    def _build_zero_frame_mask(self) -> np.ndarray:
+        """Boolean mask over frames: True where every point of every group is zero."""
+        nonzero_points = np.zeros(len(self.pose_data), dtype=np.intp)
+        for point_frame, point_zero in self._group_points.values():
+            nonzero_points += np.bincount(point_frame[~point_zero], minlength=len(self.pose_data))
+        return nonzero_points == 0
+
+    def _is_frame_zero_filled(self, frame_idx: int) -> bool:
         """Check if entire frame is zero-filled (no detection)."""
-        for landmark_group in frame.values():
-            for point in landmark_group:
-                if any(coord != 0.0 for coord in point):
-                    return False
-        return True
+        return bool(self._zero_frame_mask[frame_idx])
 
     def _count_zero_points(self, frame: Dict) -> Tuple[int, int]:
         """Count zero vs non-zero points in a frame."""
@@ -91,7 +123,7 @@ class SignatureVerifier:
         print("=" * 60)
 
         # Count frames with detection issues
-        fully_zero_frames = sum(1 for frame in self.pose_data if self._is_frame_zero_filled(frame))
+        fully_zero_frames = int(self._zero_frame_mask.sum())
         zero_percentage = (fully_zero_frames / len(self.pose_data) * 100) if self.pose_data else 0
 
         print(f"\n🔍 Detection Integrity:")
@@ -104,15 +136,10 @@ class SignatureVerifier:
         group_stats = {}
 
         for group_name in landmark_groups:
-            zero_points = 0
-            total_points = 0
-
-            for frame in self.pose_data:
-                if group_name in frame:
-                    for point in frame[group_name]:
-                        total_points += 1
-                        if all(coord == 0.0 for coord in point):
-                            zero_points += 1
+            # One reduction over the group's stacked points
+            _, point_zero = self._group_points.get(group_name, (None, np.zeros(0, dtype=bool)))
+            zero_points = int(point_zero.sum())
+            total_points = len(point_zero)
 
             if total_points > 0:
                 group_pct = (zero_points / total_points) * 100